@@ -7,7 +7,7 @@
 CREATE EXTENSION IF NOT EXISTS "uuid-ossp";
 
 -- Create any additional extensions you might need
--- CREATE EXTENSION IF NOT EXISTS "pg_trgm";  -- For text similarity searches
+CREATE EXTENSION IF NOT EXISTS "pg_trgm";  -- Trigram indexes for regex search
 
 -- The actual table creation will be handled by SQLAlchemy/Alembic
 -- This file just sets up the database environment
@@ -18,4 +18,7 @@ logger.info('Database tables created successfully')
 "
 
 echo "Starting application..."
-exec python -m uvicorn src.api.main:app --host 0.0.0.0 --port 8000
+# Run several worker processes so CPU-bound work uses more than one core;
+# uvloop and httptools come with uvicorn[standard]
+exec python -m uvicorn src.api.main:app --host 0.0.0.0 --port 8000 \
+    --workers "${UVICORN_WORKERS:-4}" --loop uvloop --http httptools
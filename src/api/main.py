@@ -2,34 +2,64 @@
 FastAPI application for Model Registry - Phase 2.
 Implements the OpenAPI spec for ECE 461 Fall 2025 Project Phase 2.
 """
-from fastapi import FastAPI, Depends, HTTPException, Header, Request, Query
-from fastapi.responses import JSONResponse
+
+from fastapi import FastAPI, Depends, HTTPException, Header, Request, Query, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
-from sqlalchemy.orm import Session
-from sqlalchemy import or_
-from typing import List, Optional, Dict, Any
+from fastapi.middleware.gzip import GZipMiddleware
+from sqlalchemy.orm import Session, joinedload, raiseload
+from sqlalchemy import and_, bindparam, exists, func, or_, select, text
+from sqlalchemy.exc import DBAPIError
+from typing import List, Optional, Dict, Any, Callable, Iterable, Iterator
 from pydantic import BaseModel, Field
 import tempfile
+import zipfile
 import os
 import shutil
 import logging
+import json
 import time
 import re
+import anyio
+import asyncio
+import queue
+import threading
 import hashlib
-from datetime import datetime
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import unquote
 from enum import Enum
-
-from src.core.database import get_db, init_db, get_db_context
-from src.core.models import User, Package, Metrics, Lineage, DownloadHistory, Token, Rating, PackageConfusionAudit, SystemMetrics
+from functools import lru_cache, partial
+from cachetools import TTLCache
+
+from src.core.database import engine, get_db, init_db, get_db_context, init_lock
+from src.core.models import (
+    User,
+    Package,
+    Metrics,
+    Lineage,
+    DownloadHistory,
+    Token,
+    Rating,
+    PackageConfusionAudit,
+    SystemMetrics,
+)
 from src.core.auth import (
     authenticate_user,
     generate_token,
     create_user,
     verify_token,
     init_default_admin,
+    reset_default_admin,
+    clear_token_cache,
 )
+from src.crud.download import log_downloads
 from src.services.s3_service import s3_helper
 from src.services.metrics_service import MetricsEvaluator
+from src.services.huggingface_service import hf_service
+from src.utils.license_compatibility import license_checker
+from src.utils.github_license_fetcher import github_license_fetcher
 from src.core.config import settings
 from src.utils.logger import setup_logging
 
@@ -37,11 +67,27 @@ from src.utils.logger import setup_logging
 setup_logging()
 logger = logging.getLogger(__name__)
 
+# Try to import Hyperscan for scanning READMEs in the regex search fallback
+try:
+    import hyperscan
+
+    HYPERSCAN_AVAILABLE = True
+except ImportError:
+    HYPERSCAN_AVAILABLE = False
+
+# Try to import RE2 for linear-time matching in the regex search fallback
+try:
+    import re2
+
+    RE2_AVAILABLE = True
+except ImportError:
+    RE2_AVAILABLE = False
+
 # Create FastAPI app
 app = FastAPI(
     title="ECE 461 - Fall 2025 - Project Phase 2",
     version="3.4.7",
-    description="API for ECE 461/Fall 2025/Project Phase 2: A Trustworthy Model Registry"
+    description="API for ECE 461/Fall 2025/Project Phase 2: A Trustworthy Model Registry",
 )
 
 # Configure CORS
@@ -53,9 +99,52 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress larger JSON bodies such as artifact listings and search results
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=5)
+
+
+class RequestIdMiddleware:
+    """
+    Tag each HTTP response with an X-Request-ID header, reusing the
+    caller's ID when one is sent.
+    Written as plain ASGI rather than BaseHTTPMiddleware so response
+    bodies pass straight through instead of being relayed over a stream.
+    """
+
+    header = b"x-request-id"
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = (
+            next(
+                (value for name, value in scope["headers"] if name == self.header), None
+            )
+            or uuid.uuid4().hex.encode()
+        )
+
+        async def send_with_request_id(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (self.header, request_id),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
+
+
+app.add_middleware(RequestIdMiddleware)
+
 
 # ========== Enums and Pydantic Models ==========
 
+
 class ArtifactType(str, Enum):
     model = "model"
     dataset = "dataset"
@@ -73,6 +162,12 @@ class ArtifactData(BaseModel):
     download_url: Optional[str] = None
 
 
+class ArtifactDownloadData(ArtifactData):
+    # Response-only: lets clients split large downloads into parallel ranged GETs
+    size_bytes: Optional[int] = None
+    recommended_range_mib: Optional[int] = None
+
+
 class ArtifactMetadata(BaseModel):
     name: str
     id: str
@@ -84,6 +179,11 @@ class Artifact(BaseModel):
     data: ArtifactData
 
 
+class ArtifactResponse(BaseModel):
+    metadata: ArtifactMetadata
+    data: ArtifactDownloadData
+
+
 class UserModel(BaseModel):
     name: str
     is_admin: bool
@@ -162,84 +262,202 @@ class ArtifactLineageGraph(BaseModel):
 
 # ========== Helper Functions ==========
 
+
 def generate_artifact_id(name: str, artifact_type: str) -> str:
     """Generate a numeric string ID for an artifact based on name and type."""
-    # Create a hash and convert to numeric string
-    hash_input = f"{name}:{artifact_type}:{datetime.now().isoformat()}"
-    hash_bytes = hashlib.sha256(hash_input.encode()).digest()
-    # Convert first 8 bytes to integer and take last 10 digits
-    numeric_id = int.from_bytes(hash_bytes[:8], 'big') % 10000000000
+    # IDs are only used for lookup, so a short BLAKE2b digest is enough;
+    # an 8-byte digest avoids hashing a full SHA-256 block and truncating it
+    hash_input = f"{name}:{artifact_type}:{time.time_ns()}"
+    hash_bytes = hashlib.blake2b(hash_input.encode(), digest_size=8).digest()
+    # Convert to integer and take last 10 digits
+    numeric_id = int.from_bytes(hash_bytes, "big") % 10000000000
     return str(numeric_id)
 
 
-def get_artifact_by_id(db: Session, artifact_id: str) -> Optional[Package]:
-    """Get artifact by numeric string ID."""
-    # First try to find by the stored artifact_id field
-    # Since we're transitioning, also check if the UUID string matches
-    packages = db.query(Package).all()
-    for pkg in packages:
-        # Check stored artifact_id in description (temporary storage)
-        if pkg.description and f"artifact_id:{artifact_id}" in pkg.description:
-            return pkg
-        # Also generate ID on the fly for existing packages
-        generated_id = generate_artifact_id_from_package(pkg)
-        if generated_id == artifact_id:
-            return pkg
-    return None
+def write_readme_zip(readme: str, fileobj) -> None:
+    """Write a minimal package zip containing only a README to a file object."""
+    with zipfile.ZipFile(fileobj, "w") as zf:
+        zf.writestr("README.md", readme)
+
+
+# Artifact types as stored in Package.version
+ARTIFACT_TYPE_VALUES = frozenset(t.value for t in ArtifactType)
+# Stored value -> enum member, so rows skip the ArtifactType(...) lookup
+ARTIFACT_TYPE_BY_VALUE = {t.value: t for t in ArtifactType}
+
+
+# Built once so the compiled SQL is reused from the engine's statement cache
+ARTIFACT_BY_ID_STMT = (
+    select(Package).where(Package.artifact_id == bindparam("artifact_id")).limit(1)
+)
+ARTIFACT_BY_ID_AND_TYPE_STMT = (
+    select(Package)
+    .where(
+        Package.artifact_id == bindparam("artifact_id"),
+        Package.version == bindparam("artifact_type"),
+    )
+    .limit(1)
+)
+
+
+# (artifact_id, artifact_type) -> package primary key. Only hits are cached;
+# a stale entry (package deleted by another worker) falls back to the query.
+_artifact_pk_cache = TTLCache(maxsize=4096, ttl=300)
+_artifact_pk_cache_lock = threading.Lock()
+
+
+def forget_artifact_id(artifact_id: Optional[str] = None) -> None:
+    """Drop cached lookups for one artifact ID, or for all of them."""
+    with _artifact_pk_cache_lock:
+        if artifact_id is None:
+            _artifact_pk_cache.clear()
+            return
+        for key in [k for k in _artifact_pk_cache if k[0] == artifact_id]:
+            del _artifact_pk_cache[key]
+
+
+def get_artifact_by_id(
+    db: Session,
+    artifact_id: str,
+    artifact_type: Optional[str] = None,
+    options: tuple = (),
+) -> Optional[Package]:
+    """
+    Get artifact by numeric string ID using the indexed artifact_id column.
+    Repeat lookups resolve through a cached primary key, which Session.get()
+    serves from the identity map when the package is already loaded.
+    Loader options (e.g. joinedload(Package.metrics)) apply to either path.
+    """
+    cache_key = (artifact_id, artifact_type)
+    with _artifact_pk_cache_lock:
+        package_pk = _artifact_pk_cache.get(cache_key)
+    if package_pk is not None:
+        package = db.get(Package, package_pk, options=options)
+        if package is not None:
+            return package
+
+    if artifact_type:
+        stmt = ARTIFACT_BY_ID_AND_TYPE_STMT
+        params = {"artifact_id": artifact_id, "artifact_type": artifact_type}
+    else:
+        stmt = ARTIFACT_BY_ID_STMT
+        params = {"artifact_id": artifact_id}
+    if options:
+        stmt = stmt.options(*options)
+    package = db.execute(stmt, params).unique().scalars().first()
+
+    if package is not None:
+        with _artifact_pk_cache_lock:
+            _artifact_pk_cache[cache_key] = package.id
+    return package
 
 
 def generate_artifact_id_from_package(pkg: Package) -> str:
-    """Get artifact ID from package - uses the stored ID from description field."""
-    # The artifact_id is stored in the description field during creation
+    """Get artifact ID from package - uses the stored artifact_id column."""
+    if pkg.artifact_id:
+        return pkg.artifact_id
+    # Legacy packages stored the artifact_id in the description field
     if pkg.description and "artifact_id:" in pkg.description:
         # Extract stored artifact_id
         return pkg.description.replace("artifact_id:", "")
     # Fallback: generate from UUID (for legacy packages without stored ID)
     hash_bytes = hashlib.sha256(str(pkg.id).encode()).digest()
-    numeric_id = int.from_bytes(hash_bytes[:8], 'big') % 10000000000
+    numeric_id = int.from_bytes(hash_bytes[:8], "big") % 10000000000
     return str(numeric_id)
 
 
+def backfill_artifact_ids(db: Session) -> int:
+    """Populate artifact_id for packages created before the column existed."""
+    packages = db.query(Package).filter(Package.artifact_id.is_(None)).all()
+    for pkg in packages:
+        pkg.artifact_id = generate_artifact_id_from_package(pkg)
+    if packages:
+        db.commit()
+        logger.info("Backfilled artifact_id for %s packages", len(packages))
+    return len(packages)
+
+
+# Matches supported source URLs in one pass, e.g.
+#   https://huggingface.co/google-bert/bert-base-uncased/tree/main
+#   https://huggingface.co/datasets/squad
+#   https://github.com/owner/repo
+ARTIFACT_URL_RE = re.compile(
+    r"^https?://(?:www\.)?(?P<host>huggingface\.co|github\.com|gitlab\.com)/"
+    r"(?P<datasets>datasets/)?"
+    # A lone segment followed by a ref path is a namespace-less repo id
+    r"(?P<repo_id>(?:[^/]+/(?!(?:tree|blob|resolve|raw)/))?(?P<name>[^/]+?))"
+    # Any page below the repository (tree/main, discussions, issues/1, ...)
+    r"(?:/.*)?$",
+    re.IGNORECASE,
+)
+
+
+def parse_artifact_url(url: str) -> Optional[re.Match]:
+    """
+    Parse a HuggingFace/GitHub/GitLab URL.
+    The match exposes host, datasets (set for HF datasets), repo_id and name.
+    Returns None for unsupported URLs.
+    """
+    return ARTIFACT_URL_RE.match(url)
+
+
 def get_artifact_type_from_url(url: str) -> ArtifactType:
     """Determine artifact type from URL."""
-    url_lower = url.lower()
-    if "huggingface.co/datasets" in url_lower:
-        return ArtifactType.dataset
-    elif "github.com" in url_lower or "gitlab.com" in url_lower:
-        return ArtifactType.code
-    else:
-        # Default to model for huggingface.co URLs
-        return ArtifactType.model
+    match = parse_artifact_url(url)
+    if match:
+        if match["datasets"]:
+            return ArtifactType.dataset
+        if match["host"].lower() != "huggingface.co":
+            return ArtifactType.code
+    # Default to model for huggingface.co URLs
+    return ArtifactType.model
 
 
 def extract_name_from_url(url: str) -> str:
     """Extract artifact name from URL."""
-    # HuggingFace model: https://huggingface.co/google-bert/bert-base-uncased
-    # HuggingFace dataset: https://huggingface.co/datasets/squad
-    # GitHub: https://github.com/owner/repo
-
-    if "huggingface.co" in url:
-        parts = url.rstrip('/').split('/')
-        if "datasets" in parts:
-            # Dataset URL
-            idx = parts.index("datasets")
-            if idx + 1 < len(parts):
-                return parts[-1]  # Last part is the name
-        else:
-            # Model URL - take last part
-            return parts[-1]
-    elif "github.com" in url:
-        parts = url.rstrip('/').split('/')
-        if len(parts) >= 2:
-            return parts[-1]  # repo name
+    match = parse_artifact_url(url)
+    if match:
+        return match["name"]
 
     # Fallback: use last part of URL
-    return url.rstrip('/').split('/')[-1]
+    return url.rstrip("/").split("/")[-1]
+
+
+def compute_etag(*parts) -> str:
+    """Build a strong ETag from the values a response body is derived from."""
+    digest = hashlib.blake2b(
+        "\x1f".join(map(str, parts)).encode(), digest_size=8
+    ).hexdigest()
+    return f'"{digest}"'
+
 
+# Suggested byte-range size for parallel downloads of the presigned URL;
+# S3 serves Range requests on presigned GETs without extra signing
+DOWNLOAD_RANGE_MIB = 16
 
-async def get_current_user_from_header(
+
+# Clients may keep a copy but must revalidate it, since a reset or delete
+# can change the answer at any time; the ETag makes that a cheap 304
+CACHE_CONTROL = "private, no-cache"
+
+
+def not_modified(request: Request, response: Response, etag: str) -> bool:
+    """
+    Set the ETag header and report whether the client's copy is current.
+    When this returns True the caller should answer 304 with no body.
+    """
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = CACHE_CONTROL
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+    return etag in candidates or "*" in candidates
+
+
+def get_current_user_from_header(
     x_authorization: Optional[str] = Header(default=None, alias="X-Authorization"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
 ) -> Optional[User]:
     """Get current user from X-Authorization header."""
     if not x_authorization:
@@ -254,9 +472,9 @@ async def get_current_user_from_header(
     return user
 
 
-async def require_auth(
+def require_auth(
     x_authorization: str = Header(..., alias="X-Authorization"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
 ) -> User:
     """Require authentication."""
     if not x_authorization:
@@ -272,53 +490,139 @@ async def require_auth(
     return user
 
 
+# ========== Download History ==========
+
+# Downloads are queued on the request path and written in batches
+DOWNLOAD_FLUSH_INTERVAL = 0.5  # seconds
+_download_queue: "queue.SimpleQueue[Dict[str, Any]]" = queue.SimpleQueue()
+_download_flusher: Optional[asyncio.Task] = None
+
+
+def record_download(package_id, user_id=None) -> None:
+    """Queue a download-history row for the next batch insert."""
+    _download_queue.put({"package_id": package_id, "user_id": user_id})
+
+
+def flush_downloads(db: Session) -> int:
+    """Write every queued download in a single INSERT."""
+    batch = []
+    while True:
+        try:
+            batch.append(_download_queue.get_nowait())
+        except queue.Empty:
+            break
+    return log_downloads(db, batch)
+
+
+def _flush_downloads_in_session() -> None:
+    with get_db_context() as db:
+        flush_downloads(db)
+
+
+async def _flush_downloads_periodically():
+    """Background task that drains the download queue until cancelled."""
+    while True:
+        await asyncio.sleep(DOWNLOAD_FLUSH_INTERVAL)
+        if _download_queue.empty():
+            continue
+        try:
+            await run_in_threadpool(_flush_downloads_in_session)
+        except Exception as e:
+            logger.error("Failed to write download history: %s", e)
+
+
 # ========== Startup/Shutdown Events ==========
 
+
 @app.on_event("startup")
 async def startup_event():
     """Initialize database and default admin on startup."""
     logger.info("Starting Model Registry API...")
-    init_db()
 
-    with get_db_context() as db:
-        init_default_admin(db)
+    # Blocking work (HF downloads, S3 transfers, DB queries) runs in anyio's
+    # worker threads; the default limit of 40 lets a few long ingests starve
+    # every other sync endpoint
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.threadpool_size
+    )
+
+    # Every worker process runs this hook; serialize first-boot initialization
+    with init_lock():
+        init_db()
+
+        with get_db_context() as db:
+            init_default_admin(db)
+            backfill_artifact_ids(db)
+
+    global _download_flusher
+    _download_flusher = asyncio.create_task(_flush_downloads_periodically())
 
     logger.info("API startup complete")
 
 
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Stop the download flusher and write anything still queued."""
+    if _download_flusher:
+        _download_flusher.cancel()
+    if not _download_queue.empty():
+        await run_in_threadpool(_flush_downloads_in_session)
+
+
 # ========== Health Endpoints ==========
 
 # Track application start time for uptime calculation
 import psutil
 from datetime import datetime as dt
+
 _app_start_time = dt.now()
+# Prime psutil so later non-blocking cpu_percent() calls have a baseline
+psutil.cpu_percent(interval=None)
+
+# Probes from load balancers and monitors share one result for a few
+# seconds instead of each running the database and S3 checks
+HEALTH_CACHE_TTL = 2
+_health_cache = TTLCache(maxsize=1, ttl=HEALTH_CACHE_TTL)
+_health_cache_lock = threading.Lock()
+
 
 @app.get("/health")
-async def health_check(db: Session = Depends(get_db)):
+def health_check():
     """
     Heartbeat check (BASELINE) with detailed component health.
     Returns comprehensive health status for the dashboard.
     """
+    # Concurrent probes on a miss wait for the one check in flight
+    with _health_cache_lock:
+        health = _health_cache.get("health")
+        if health is None:
+            health = _check_health()
+            _health_cache["health"] = health
+    return health
+
+
+def _check_health() -> Dict[str, Any]:
+    """Run the component checks behind /health."""
     components = {}
     overall_status = "healthy"
 
     # Check database health
     db_start = time.time()
     try:
-        from sqlalchemy import text
-        db.execute(text("SELECT 1"))
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
         db_response_time = (time.time() - db_start) * 1000
         components["database"] = {
             "status": "healthy",
             "response_time": round(db_response_time, 2),
-            "message": "Connected to PostgreSQL"
+            "message": "Connected to PostgreSQL",
         }
     except Exception as e:
         db_response_time = (time.time() - db_start) * 1000
         components["database"] = {
             "status": "down",
             "response_time": round(db_response_time, 2),
-            "message": f"Database error: {str(e)}"
+            "message": f"Database error: {str(e)}",
         }
         overall_status = "degraded"
 
@@ -332,13 +636,13 @@ async def health_check(db: Session = Depends(get_db)):
             components["s3"] = {
                 "status": "healthy",
                 "response_time": round(s3_response_time, 2),
-                "message": f"Connected to bucket: {s3_helper.bucket_name}"
+                "message": f"Connected to bucket: {s3_helper.bucket_name}",
             }
         else:
             components["s3"] = {
                 "status": "degraded",
                 "response_time": round(s3_response_time, 2),
-                "message": "S3 bucket not configured"
+                "message": "S3 bucket not configured",
             }
             if overall_status == "healthy":
                 overall_status = "degraded"
@@ -347,7 +651,7 @@ async def health_check(db: Session = Depends(get_db)):
         components["s3"] = {
             "status": "down",
             "response_time": round(s3_response_time, 2),
-            "message": f"S3 error: {str(e)}"
+            "message": f"S3 error: {str(e)}",
         }
         overall_status = "degraded"
 
@@ -357,17 +661,19 @@ async def health_check(db: Session = Depends(get_db)):
     components["api"] = {
         "status": "healthy",
         "response_time": round(api_response_time, 2),
-        "message": "API responding normally"
+        "message": "API responding normally",
     }
 
     # System metrics
     try:
-        cpu_percent = psutil.cpu_percent(interval=0.1)
+        cpu_percent = psutil.cpu_percent(interval=None)
         memory = psutil.virtual_memory()
         components["system"] = {
-            "status": "healthy" if cpu_percent < 90 and memory.percent < 90 else "degraded",
+            "status": (
+                "healthy" if cpu_percent < 90 and memory.percent < 90 else "degraded"
+            ),
             "response_time": 0,
-            "message": f"CPU: {cpu_percent:.1f}%, Memory: {memory.percent:.1f}%"
+            "message": f"CPU: {cpu_percent:.1f}%, Memory: {memory.percent:.1f}%",
         }
         if cpu_percent >= 90 or memory.percent >= 90:
             if overall_status == "healthy":
@@ -376,7 +682,7 @@ async def health_check(db: Session = Depends(get_db)):
         components["system"] = {
             "status": "unknown",
             "response_time": 0,
-            "message": "Unable to retrieve system metrics"
+            "message": "Unable to retrieve system metrics",
         }
 
     # Calculate uptime
@@ -388,38 +694,30 @@ async def health_check(db: Session = Depends(get_db)):
         "uptime": int(uptime_seconds),
         "version": app.version,
         "environment": settings.environment,
-        "timestamp": dt.now().isoformat()
+        "timestamp": dt.now().isoformat(),
     }
 
 
-@app.get("/tracks")
+@app.get("/tracks", response_model=Dict[str, List[str]])
 async def get_tracks():
     """Get the list of tracks implemented."""
-    return {
-        "plannedTracks": ["Access control track"]
-    }
+    return {"plannedTracks": ["Access control track"]}
 
 
 # ========== Authentication ==========
 
-@app.put("/authenticate")
-async def authenticate_put(auth_req: AuthenticationRequest, db: Session = Depends(get_db)):
+
+@app.api_route("/authenticate", methods=["PUT", "POST"], response_model=str)
+def authenticate(auth_req: AuthenticationRequest, db: Session = Depends(get_db)):
     """
-    Create an access token. (NON-BASELINE) - PUT method per spec
+    Create an access token. (NON-BASELINE)
+    PUT per spec; POST is also accepted for frontend compatibility.
+    Runs in the threadpool so bcrypt verification does not block the event loop.
     """
-    user = authenticate_user(db, auth_req.user.name, auth_req.secret.password)
-    if not user:
+    # Reject empty credentials before the database lookup and bcrypt check
+    if not auth_req.user.name or not auth_req.secret.password:
         raise HTTPException(status_code=401, detail="Invalid credentials")
 
-    token = generate_token(db, user)
-    return f"bearer {token}"
-
-
-@app.post("/authenticate")
-async def authenticate_post(auth_req: AuthenticationRequest, db: Session = Depends(get_db)):
-    """
-    Create an access token - POST method for frontend compatibility
-    """
     user = authenticate_user(db, auth_req.user.name, auth_req.secret.password)
     if not user:
         raise HTTPException(status_code=401, detail="Invalid credentials")
@@ -430,10 +728,11 @@ async def authenticate_post(auth_req: AuthenticationRequest, db: Session = Depen
 
 # ========== Reset ==========
 
-@app.delete("/reset")
-async def reset_registry(
+
+@app.delete("/reset", response_model=Dict[str, str])
+def reset_registry(
     x_authorization: Optional[str] = Header(None, alias="X-Authorization"),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
 ):
     """
     Reset the registry to a system default state. (BASELINE)
@@ -444,78 +743,278 @@ async def reset_registry(
     # Step 1: Delete all S3 objects
     try:
         deleted_count = s3_helper.delete_all_objects()
-        logger.info(f"Deleted {deleted_count} S3 objects")
+        logger.info("Deleted %s S3 objects", deleted_count)
     except Exception as e:
-        logger.error(f"Failed to delete S3 objects: {e}")
+        logger.error("Failed to delete S3 objects: %s", e)
 
-    # Step 2: Delete all related records (in correct order to respect foreign keys)
-    # Delete in order: dependent tables first, then packages
+    # Step 2: Clear all registry tables and reset the admin in a single transaction
     try:
-        # Delete download history
-        db.query(DownloadHistory).delete()
+        if db.get_bind().dialect.name == "postgresql":
+            # One round-trip; TRUNCATE skips per-row delete work and cascades foreign keys
+            db.execute(
+                text(
+                    "TRUNCATE TABLE download_history, ratings, lineage, metrics, "
+                    "package_confusion_audit, system_metrics, packages, tokens "
+                    "RESTART IDENTITY CASCADE"
+                )
+            )
+        else:
+            # Fallback for SQLite: delete dependent tables first, then packages and tokens
+            for model in (
+                DownloadHistory,
+                Rating,
+                Lineage,
+                Metrics,
+                PackageConfusionAudit,
+                SystemMetrics,
+                Package,
+                Token,
+            ):
+                db.query(model).delete()
+
+        # Step 3: Verify no packages remain before touching the admin;
+        # fetching a single id stops at the first row instead of counting
+        if db.execute(select(Package.id).limit(1)).first() is not None:
+            logger.error("Reset verification failed: packages still exist")
+            raise HTTPException(status_code=500, detail="Reset verification failed")
+
+        # Step 4: Reset the default admin so its password matches current config
+        reset_default_admin(db)
 
-        # Delete ratings
-        db.query(Rating).delete()
+        db.commit()
+        clear_token_cache()
+        forget_artifact_id()
 
-        # Delete lineage
-        db.query(Lineage).delete()
+    except HTTPException:
+        db.rollback()
+        raise
+    except Exception as e:
+        logger.error("Failed to reset database records: %s", e)
+        db.rollback()
+        raise HTTPException(status_code=500, detail="Reset failed")
 
-        # Delete metrics
-        db.query(Metrics).delete()
+    logger.info("System reset complete - verified 0 packages remain")
+    return {"message": "Registry reset"}
 
-        # Delete package confusion audit
-        db.query(PackageConfusionAudit).delete()
 
-        # Delete system metrics
-        db.query(SystemMetrics).delete()
+# ========== Regex Search ==========
 
-        # Delete all packages
-        db.query(Package).delete()
+# Rows fetched per round-trip while streaming matches
+REGEX_SEARCH_BATCH_SIZE = 500
 
-        # Delete all tokens (users can re-authenticate)
-        db.query(Token).delete()
 
-        # Commit all deletions
-        db.commit()
+# Registered before POST /artifact/{artifact_type}, which would otherwise
+# capture "byRegEx" as an artifact type and reject the request
+@app.post("/artifact/byRegEx", response_model=List[ArtifactMetadata])
+def search_by_regex(regex_req: ArtifactRegEx, db: Session = Depends(get_db)):
+    """
+    Get any artifacts fitting the regular expression. (BASELINE)
 
-        # Force a flush to ensure changes are visible
-        db.flush()
+    NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
+    """
+    pattern = regex_req.regex
 
-    except Exception as e:
-        logger.error(f"Failed to delete database records: {e}")
-        db.rollback()
-        raise HTTPException(status_code=500, detail="Reset failed")
+    compiled = _compile_regex(pattern)
+    if compiled is None:
+        raise HTTPException(status_code=400, detail="Invalid regex pattern")
+
+    # Only the columns needed for the response are loaded, never full ORM rows,
+    # and rows are fetched in batches as the response is streamed
+    matches = None
+    if db.get_bind().dialect.name == "postgresql" and _postgres_compatible(pattern):
+        # Let Postgres evaluate the regex (backed by the trigram indexes)
+        try:
+            matches = iter(
+                db.execute(
+                    select(Package.name, Package.artifact_id, Package.version)
+                    .where(
+                        or_(
+                            Package.name.op("~*")(pattern),
+                            Package.model_card.op("~*")(pattern),
+                        )
+                    )
+                    .execution_options(yield_per=REGEX_SEARCH_BATCH_SIZE)
+                )
+            )
+        except DBAPIError:
+            # Python-only syntax such as (?P<name>...) is rejected by Postgres
+            db.rollback()
+
+    if matches is None:
+        # Search in name and model_card (README)
+        linear = _compile_re2(pattern) if RE2_AVAILABLE else None
+        matches = _scan_packages(
+            db,
+            search_name=(linear or compiled).search,
+            search_readme=_compile_readme_matcher(pattern, linear or compiled),
+        )
+
+    first = next(matches, None)
+    if first is None:
+        raise HTTPException(
+            status_code=404, detail="No artifact found under this regex"
+        )
 
-    # Step 3: Re-initialize the default admin user with correct password
-    # Delete and recreate to ensure password matches current config
+    return StreamingResponse(
+        _stream_artifact_metadata(first, matches), media_type="application/json"
+    )
+
+
+# An unescaped \b or \B: a word boundary in Python but a backspace in
+# Postgres regexes (which spell the boundary \y)
+_POSTGRES_DIVERGENT_ESCAPE_RE = re.compile(r"(?<!\\)(?:\\\\)*\\[bB]")
+
+
+def _postgres_compatible(pattern: str) -> bool:
+    """Whether Postgres' ~* reads the pattern the way Python's re does."""
+    return _POSTGRES_DIVERGENT_ESCAPE_RE.search(pattern) is None
+
+
+@lru_cache(maxsize=512)
+def _compile_regex(pattern: str) -> Optional[re.Pattern]:
+    """Compile a search pattern once per distinct string; None if invalid."""
     try:
-        admin = db.query(User).filter(User.username == settings.admin_username).first()
-        if admin:
-            db.delete(admin)
-            db.commit()
-        # Recreate admin with current config password
-        init_default_admin(db)
-    except Exception as e:
-        logger.error(f"Failed to reinitialize admin user: {e}")
+        return re.compile(pattern, re.IGNORECASE)
+    except re.error:
+        return None
 
-    # Step 4: Verify reset was successful
-    package_count = db.query(Package).count()
-    if package_count != 0:
-        logger.error(f"Reset verification failed: {package_count} packages still exist")
-        raise HTTPException(status_code=500, detail="Reset verification failed")
 
-    logger.info("System reset complete - verified 0 packages remain")
-    return {"message": "Registry reset"}
+@lru_cache(maxsize=512)
+def _compile_re2(pattern: str):
+    """
+    Compile a search pattern with RE2, whose matching time is linear in the
+    input, so a hostile pattern cannot backtrack catastrophically. Returns
+    None for syntax RE2 does not support (backreferences, lookaround).
+    """
+    try:
+        return re2.compile("(?i)" + pattern)
+    except re2.error:
+        return None
+
+
+@lru_cache(maxsize=512)
+def _compile_hyperscan(pattern: str):
+    """
+    Compile a search pattern into a Hyperscan database once per distinct
+    string. Returns None for patterns Hyperscan does not support
+    (backreferences, lookaround).
+    """
+    database = hyperscan.Database()
+    try:
+        database.compile(
+            expressions=[pattern.encode()],
+            flags=[
+                hyperscan.HS_FLAG_CASELESS
+                | hyperscan.HS_FLAG_SINGLEMATCH
+                | hyperscan.HS_FLAG_UTF8
+                | hyperscan.HS_FLAG_UCP
+            ],
+        )
+    except hyperscan.error:
+        return None
+    return database
+
+
+def _compile_readme_matcher(pattern: str, compiled) -> Callable[[str], bool]:
+    """
+    Return a predicate that tests a README against the search pattern.
+    READMEs are long, so Hyperscan's DFA is used when it is installed and
+    accepts the pattern; otherwise the given compiled pattern (RE2 or re).
+    """
+    database = _compile_hyperscan(pattern) if HYPERSCAN_AVAILABLE else None
+    if database is not None:
+        # The compiled database is shared; scratch space is per request
+        scratch = hyperscan.Scratch(database)
+
+        def search_readme(text: str) -> bool:
+            found = []
+            database.scan(
+                text.encode(),
+                match_event_handler=lambda *_: found.append(True),
+                scratch=scratch,
+            )
+            return bool(found)
+
+        return search_readme
+
+    return lambda text: compiled.search(text) is not None
+
+
+def _scan_packages(
+    db: Session,
+    search_name: Callable[[str], Any],
+    search_readme: Callable[[str], bool],
+) -> Iterator:
+    """
+    Yield (name, artifact_id, version) rows whose name or README matches.
+    Names are tested first; READMEs are fetched, one query per batch, only
+    for the rows whose name did not match.
+    """
+    rows = db.execute(
+        select(
+            Package.name, Package.artifact_id, Package.version, Package.id
+        ).execution_options(yield_per=REGEX_SEARCH_BATCH_SIZE)
+    )
+    for batch in rows.partitions():
+        misses = [row.id for row in batch if not search_name(row.name)]
+        readme_hits = set()
+        if misses:
+            readme_hits = {
+                package_id
+                for package_id, model_card in db.execute(
+                    select(Package.id, Package.model_card).where(
+                        Package.id.in_(misses), Package.model_card.is_not(None)
+                    )
+                )
+                if search_readme(model_card)
+            }
+        missed = set(misses)
+        for row in batch:
+            if row.id not in missed or row.id in readme_hits:
+                yield row
+
+
+def _stream_artifact_metadata(first, rows: Iterable) -> Iterator[str]:
+    """Yield a JSON array of artifact metadata, one element per row."""
+
+    def encode(row) -> str:
+        name, artifact_id, version = row[0], row[1], row[2]
+        artifact_type = version if version in ARTIFACT_TYPE_VALUES else "model"
+        return json.dumps({"name": name, "id": artifact_id, "type": artifact_type})
+
+    yield "[" + encode(first)
+    for row in rows:
+        yield "," + encode(row)
+    yield "]"
 
 
 # ========== Artifact Ingestion ==========
 
-@app.post("/artifact/{artifact_type}", status_code=201)
-async def create_artifact(
+# Metrics evaluation runs beside the download and upload of a model
+_evaluation_executor = ThreadPoolExecutor(
+    max_workers=settings.evaluation_workers, thread_name_prefix="metrics"
+)
+
+
+def _evaluate_model(url: str, package_id: uuid.UUID) -> Dict[str, Any]:
+    """Evaluate a model's metrics in a session of its own."""
+    with get_db_context() as db:
+        evaluator = MetricsEvaluator(
+            model_url=url,
+            dataset_url="",
+            code_url="",
+            db_session=db,
+            package_id=package_id,
+        )
+        return evaluator.evaluate()
+
+
+@app.post("/artifact/{artifact_type}", status_code=201, response_model=ArtifactResponse)
+def create_artifact(
     artifact_type: ArtifactType,
     artifact_data: ArtifactData,
     db: Session = Depends(get_db),
-    user: Optional[User] = Depends(get_current_user_from_header)
+    user: Optional[User] = Depends(get_current_user_from_header),
 ):
     """
     Register a new artifact. (BASELINE)
@@ -528,152 +1027,143 @@ async def create_artifact(
         user = db.query(User).filter(User.username == settings.admin_username).first()
         if not user:
             raise HTTPException(status_code=500, detail="Default admin user not found")
-    from src.services.huggingface_service import hf_service
 
     url = artifact_data.url
-    logger.info(f"Ingesting {artifact_type.value} from URL: {url}")
+    logger.info("Ingesting %s from URL: %s", artifact_type.value, url)
 
     if artifact_data.name:
         name = artifact_data.name
-        logger.info(f"Using provided name: {name}")
+        logger.info("Using provided name: %s", name)
     else:
         name = extract_name_from_url(url)
-        logger.info(f"Extracted name from URL: {name}")
+        logger.info("Extracted name from URL: %s", name)
 
     # Check if artifact already exists with same name and type
-    existing = db.query(Package).filter(
-        Package.name == name,
-        Package.version == artifact_type.value  # Store type in version field
-    ).first()
+    existing = db.query(
+        exists().where(
+            Package.name == name,
+            Package.version == artifact_type.value,  # Store type in version field
+        )
+    ).scalar()
 
     if existing:
         raise HTTPException(status_code=409, detail="Artifact exists already")
 
+    # Return the connection to the pool for the download and upload; the
+    # session checks out a fresh one for the final insert
+    db.close()
+
     # Create temp directory for downloads
     temp_dir = tempfile.mkdtemp(prefix="artifact_ingest_")
-    temp_zip_path = None
+    package_id = uuid.uuid4()
+    evaluation = None
 
     try:
-        # Download based on artifact type and URL
-        if "huggingface.co" in url:
+        # Download based on artifact type and URL; each branch decides how the
+        # package zip is written so it can be streamed straight to S3
+        match = parse_artifact_url(url)
+        host = match["host"].lower() if match else None
+
+        # Score every model, whatever its host, while its package is
+        # downloaded and uploaded
+        if artifact_type == ArtifactType.model and host in (
+            "huggingface.co",
+            "github.com",
+        ):
+            evaluation = _evaluation_executor.submit(_evaluate_model, url, package_id)
+
+        if host == "huggingface.co":
             if artifact_type == ArtifactType.model:
-                # Extract model ID from URL
                 # https://huggingface.co/google-bert/bert-base-uncased -> google-bert/bert-base-uncased
-                parts = url.rstrip('/').split('huggingface.co/')
-                if len(parts) > 1:
-                    model_id = parts[1]
-                    # Remove /tree/main or similar suffixes
-                    if '/tree/' in model_id:
-                        model_id = model_id.split('/tree/')[0]
-                else:
-                    model_id = name
-
-                model_path, metadata = hf_service.download_model(model_id, cache_dir=temp_dir)
-                temp_zip_path = os.path.join(temp_dir, "package.zip")
-                size_bytes = hf_service.create_package_zip(model_path, temp_zip_path)
-
-                # Extract license
-                license_str = "unknown"
-                if metadata.get("tags"):
-                    for tag in metadata["tags"]:
-                        if tag.startswith("license:"):
-                            license_str = tag.replace("license:", "")
-                            break
+                model_id = match["repo_id"]
+
+                model_path, metadata = hf_service.download_model(
+                    model_id, cache_dir=temp_dir
+                )
+                write_package = partial(hf_service.write_package_zip, model_path)
+
+                license_str = hf_service.extract_license(metadata)
 
             elif artifact_type == ArtifactType.dataset:
-                parts = url.rstrip('/').split('datasets/')
-                if len(parts) > 1:
-                    dataset_id = parts[1]
-                    if '/tree/' in dataset_id:
-                        dataset_id = dataset_id.split('/tree/')[0]
-                else:
-                    dataset_id = name
+                dataset_id = match["repo_id"]
 
                 try:
-                    dataset_path, metadata = hf_service.download_dataset(dataset_id, cache_dir=temp_dir)
-                    temp_zip_path = os.path.join(temp_dir, "package.zip")
-                    size_bytes = hf_service.create_package_zip(dataset_path, temp_zip_path)
+                    dataset_path, metadata = hf_service.download_dataset(
+                        dataset_id, cache_dir=temp_dir
+                    )
+                    write_package = partial(hf_service.write_package_zip, dataset_path)
                     license_str = "unknown"
                 except Exception as e:
-                    logger.error(f"Dataset download failed: {e}")
+                    logger.error("Dataset download failed: %s", e)
                     # For very large datasets that timeout, create a minimal package with metadata
-                    temp_zip_path = os.path.join(temp_dir, "package.zip")
-                    import zipfile
-                    with zipfile.ZipFile(temp_zip_path, 'w') as zf:
-                        zf.writestr("README.md", f"# {name}\n\nSource: {url}\n\nNote: Dataset too large to fully download, metadata stored only.")
-                    size_bytes = os.path.getsize(temp_zip_path)
+                    write_package = partial(
+                        write_readme_zip,
+                        f"# {name}\n\nSource: {url}\n\nNote: Dataset too large to fully download, metadata stored only.",
+                    )
                     license_str = "unknown"
 
             else:
-                raise HTTPException(status_code=400, detail="Code artifacts must use GitHub URLs")
+                raise HTTPException(
+                    status_code=400, detail="Code artifacts must use GitHub URLs"
+                )
 
-        elif "github.com" in url:
+        elif host == "github.com":
             # For GitHub, we just store the URL reference
             # Create a minimal package
-            temp_zip_path = os.path.join(temp_dir, "package.zip")
-            import zipfile
-            with zipfile.ZipFile(temp_zip_path, 'w') as zf:
-                zf.writestr("README.md", f"# {name}\n\nSource: {url}")
-            size_bytes = os.path.getsize(temp_zip_path)
+            write_package = partial(write_readme_zip, f"# {name}\n\nSource: {url}")
             license_str = "unknown"
             metadata = {}
         else:
-            raise HTTPException(status_code=400, detail="URL must be from HuggingFace or GitHub")
+            raise HTTPException(
+                status_code=400, detail="URL must be from HuggingFace or GitHub"
+            )
 
         # Generate artifact ID
         artifact_id = generate_artifact_id(name, artifact_type.value)
 
-        # Upload to S3
+        # Stream the package zip to S3 (no intermediate zip file on disk)
         s3_key = s3_helper.build_s3_path(name, artifact_type.value)
-        success = s3_helper.upload_file(temp_zip_path, s3_key)
-        if not success:
+        size_bytes = s3_helper.upload_stream(s3_key, write_package)
+        if size_bytes is None:
             raise HTTPException(status_code=500, detail="Failed to upload to S3")
 
         s3_path = s3_helper.build_full_s3_url(s3_key)
 
-        # Create package entry
-        # Store artifact_id in description for lookup
-        package = Package(
-            name=name,
-            version=artifact_type.value,  # Store type in version field
-            uploader_id=user.id,
-            s3_path=s3_path,
-            description=f"artifact_id:{artifact_id}",
-            license=license_str,
-            size_bytes=size_bytes,
-            model_card=url  # Store original URL in model_card
-        )
-        db.add(package)
-        db.commit()
-        db.refresh(package)
-
-        # Run metrics evaluation for models
-        if artifact_type == ArtifactType.model:
+        # Collect the model's metrics; a failed evaluation registers the
+        # artifact without them
+        eval_result = None
+        if evaluation is not None:
             try:
-                evaluator = MetricsEvaluator(
-                    model_url=url,
-                    dataset_url="",
-                    code_url="",
-                    db_session=db,
-                    package_id=package.id
-                )
-                eval_result = evaluator.evaluate()
-
-                # Check if metrics meet threshold
-                license_score = eval_result.get("license", 0)
-                if license_score < 0.5:
-                    # Delete package and return 424
-                    db.delete(package)
-                    db.commit()
-                    s3_helper.delete_file(s3_key)
-                    raise HTTPException(
-                        status_code=424,
-                        detail="Artifact is not registered due to the disqualified rating"
-                    )
+                eval_result = evaluation.result()
+            except Exception as e:
+                logger.error("Metrics evaluation failed: %s", e)
+
+        # Check if metrics meet threshold before anything is written
+        if eval_result is not None and eval_result.get("license", 0) < 0.5:
+            s3_helper.delete_file(s3_key)
+            raise HTTPException(
+                status_code=424,
+                detail="Artifact is not registered due to the disqualified rating",
+            )
 
-                # Store metrics
-                metrics = Metrics(
-                    package_id=package.id,
+        # Create package entry, with its metrics in the same transaction
+        db.add(
+            Package(
+                id=package_id,
+                name=name,
+                version=artifact_type.value,  # Store type in version field
+                artifact_id=artifact_id,  # Indexed lookup key
+                uploader_id=user.id,
+                s3_path=s3_path,
+                license=license_str,
+                size_bytes=size_bytes,
+                model_card=url,  # Store original URL in model_card
+            )
+        )
+        if eval_result is not None:
+            db.add(
+                Metrics(
+                    package_id=package_id,
                     bus_factor=eval_result.get("bus_factor", 0),
                     ramp_up=eval_result.get("ramp_up_time", 0),
                     license_score=eval_result.get("license", 0),
@@ -687,47 +1177,44 @@ async def create_artifact(
                     reviewedness=eval_result.get("reviewedness", 0),
                     tree_score=eval_result.get("treescore", 0),
                 )
-                db.add(metrics)
-                db.commit()
-            except HTTPException:
-                raise
-            except Exception as e:
-                logger.error(f"Metrics evaluation failed: {e}")
-                # Continue without metrics
+            )
+        db.commit()
 
         # Generate download URL
         download_url = s3_helper.generate_presigned_url(s3_key, expiration=3600)
 
-        return Artifact(
-            metadata=ArtifactMetadata(
-                name=name,
-                id=artifact_id,
-                type=artifact_type
-            ),
-            data=ArtifactData(
+        return ArtifactResponse(
+            metadata=ArtifactMetadata(name=name, id=artifact_id, type=artifact_type),
+            data=ArtifactDownloadData(
                 url=url,
-                download_url=download_url
-            )
+                download_url=download_url,
+                size_bytes=size_bytes,
+                recommended_range_mib=DOWNLOAD_RANGE_MIB,
+            ),
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Artifact ingestion failed: {e}", exc_info=True)
+        logger.error("Artifact ingestion failed: %s", e, exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
     finally:
-        # Cleanup
+        # Cleanup; an evaluation that has not started yet is dropped
+        if evaluation is not None:
+            evaluation.cancel()
         if temp_dir and os.path.exists(temp_dir):
             shutil.rmtree(temp_dir)
 
 
 # ========== Artifact Search/List ==========
 
-@app.post("/artifacts")
-async def list_artifacts(
+
+@app.post("/artifacts", response_model=List[ArtifactMetadata])
+def list_artifacts(
     queries: List[ArtifactQuery],
+    response: Response,
     offset: Optional[str] = Query(None),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
 ):
     """
     Get the artifacts from the registry. (BASELINE)
@@ -738,64 +1225,55 @@ async def list_artifacts(
     offset_int = int(offset) if offset else 0
     limit = 50
 
-    results = []
-
-    if not queries or (len(queries) == 1 and queries[0].name == "*"):
-        # Return all artifacts
-        packages = db.query(Package).offset(offset_int).limit(limit).all()
-    else:
-        # Search by name
-        all_packages = []
-        seen_ids = set()
-
-        for query in queries:
-            if query.name == "*":
-                pkgs = db.query(Package).all()
-            else:
-                pkgs = db.query(Package).filter(
-                    Package.name.ilike(f"%{query.name}%")
-                ).all()
-
-            for pkg in pkgs:
-                if pkg.id not in seen_ids:
-                    # Filter by type if specified
-                    if query.types:
-                        pkg_type = pkg.version  # Type stored in version
-                        if pkg_type in [t.value for t in query.types]:
-                            all_packages.append(pkg)
-                            seen_ids.add(pkg.id)
-                    else:
-                        all_packages.append(pkg)
-                        seen_ids.add(pkg.id)
-
-        packages = all_packages[offset_int:offset_int + limit]
-
-    for pkg in packages:
-        artifact_id = generate_artifact_id_from_package(pkg)
-        artifact_type = pkg.version if pkg.version in ["model", "dataset", "code"] else "model"
-
-        results.append(ArtifactMetadata(
-            name=pkg.name,
+    # Every query becomes one OR branch of a single statement, so matching,
+    # de-duplication and pagination all happen in the database
+    conditions = []
+    for query in queries:
+        clauses = []
+        if query.name != "*":
+            clauses.append(Package.name.ilike(f"%{query.name}%"))
+        if query.types:
+            # Type is stored in version
+            clauses.append(Package.version.in_([t.value for t in query.types]))
+        if not clauses:
+            # An unfiltered wildcard matches every artifact
+            conditions = []
+            break
+        conditions.append(and_(*clauses))
+
+    # Only the response columns are loaded; artifact_id is stored, not derived
+    stmt = select(Package.name, Package.artifact_id, Package.version)
+    if conditions:
+        stmt = stmt.where(or_(*conditions))
+    packages = db.execute(
+        stmt.order_by(Package.id).offset(offset_int).limit(limit)
+    ).all()
+
+    results = [
+        ArtifactMetadata.model_construct(
+            name=name,
             id=artifact_id,
-            type=ArtifactType(artifact_type)
-        ))
+            type=ARTIFACT_TYPE_BY_VALUE.get(version, ArtifactType.model),
+        )
+        for name, artifact_id, version in packages
+    ]
 
     # Return with offset header
-    response = JSONResponse(content=[r.dict() for r in results])
     if len(packages) >= limit:
         response.headers["offset"] = str(offset_int + limit)
 
-    return response
+    return results
 
 
 # ========== Artifact CRUD ==========
 
-@app.get("/artifacts/{artifact_type}/{id}")
-async def get_artifact(
+
+@app.get("/artifacts/{artifact_type}/{id}", response_model=ArtifactResponse)
+def get_artifact(
     artifact_type: ArtifactType,
     id: str,
     db: Session = Depends(get_db),
-    user: Optional[User] = Depends(get_current_user_from_header)
+    user: Optional[User] = Depends(get_current_user_from_header),
 ):
     """
     Return this artifact. (BASELINE)
@@ -803,25 +1281,13 @@ async def get_artifact(
     NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
     """
     # Find package by artifact ID
-    package = None
-    for pkg in db.query(Package).filter(Package.version == artifact_type.value).all():
-        if generate_artifact_id_from_package(pkg) == id:
-            package = pkg
-            break
-        if pkg.description and f"artifact_id:{id}" in pkg.description:
-            package = pkg
-            break
+    package = get_artifact_by_id(db, id, artifact_type.value)
 
     if not package:
         raise HTTPException(status_code=404, detail="Artifact does not exist")
 
-    # Log download
-    download = DownloadHistory(
-        package_id=package.id,
-        user_id=user.id if user else None
-    )
-    db.add(download)
-    db.commit()
+    # Log download (written in the next batch, off the request path)
+    record_download(package.id, user.id if user else None)
 
     # Generate download URL
     s3_key = package.s3_path.replace(f"s3://{s3_helper.bucket_name}/", "")
@@ -830,39 +1296,32 @@ async def get_artifact(
     # Get original URL from model_card field, fallback to empty string if not set
     original_url = package.model_card if package.model_card else ""
 
-    return Artifact(
-        metadata=ArtifactMetadata(
-            name=package.name,
-            id=id,
-            type=artifact_type
+    return ArtifactResponse.model_construct(
+        metadata=ArtifactMetadata.model_construct(
+            name=package.name, id=id, type=artifact_type
         ),
-        data=ArtifactData(
+        data=ArtifactDownloadData.model_construct(
             url=original_url,
-            download_url=download_url
-        )
+            download_url=download_url,
+            size_bytes=package.size_bytes,
+            recommended_range_mib=DOWNLOAD_RANGE_MIB,
+        ),
     )
 
 
-@app.put("/artifacts/{artifact_type}/{id}")
-async def update_artifact(
+@app.put("/artifacts/{artifact_type}/{id}", response_model=Dict[str, str])
+def update_artifact(
     artifact_type: ArtifactType,
     id: str,
     artifact: Artifact,
     user: User = Depends(require_auth),
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
 ):
     """
     Update this content of the artifact. (BASELINE)
     """
     # Find existing package
-    package = None
-    for pkg in db.query(Package).filter(Package.version == artifact_type.value).all():
-        if generate_artifact_id_from_package(pkg) == id:
-            package = pkg
-            break
-        if pkg.description and f"artifact_id:{id}" in pkg.description:
-            package = pkg
-            break
+    package = get_artifact_by_id(db, id, artifact_type.value)
 
     if not package:
         raise HTTPException(status_code=404, detail="Artifact does not exist")
@@ -874,12 +1333,12 @@ async def update_artifact(
     return {"message": "Artifact updated"}
 
 
-@app.delete("/artifacts/{artifact_type}/{id}")
-async def delete_artifact(
+@app.delete("/artifacts/{artifact_type}/{id}", response_model=Dict[str, str])
+def delete_artifact(
     artifact_type: ArtifactType,
     id: str,
     db: Session = Depends(get_db),
-    user: Optional[User] = Depends(get_current_user_from_header)
+    user: Optional[User] = Depends(get_current_user_from_header),
 ):
     """
     Delete this artifact. (NON-BASELINE)
@@ -887,14 +1346,7 @@ async def delete_artifact(
     NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
     """
     # Find package
-    package = None
-    for pkg in db.query(Package).filter(Package.version == artifact_type.value).all():
-        if generate_artifact_id_from_package(pkg) == id:
-            package = pkg
-            break
-        if pkg.description and f"artifact_id:{id}" in pkg.description:
-            package = pkg
-            break
+    package = get_artifact_by_id(db, id, artifact_type.value)
 
     if not package:
         raise HTTPException(status_code=404, detail="Artifact does not exist")
@@ -906,91 +1358,88 @@ async def delete_artifact(
     # Delete from database
     db.delete(package)
     db.commit()
+    forget_artifact_id(id)
 
     return {"message": "Artifact deleted"}
 
 
 # ========== Model Rating ==========
 
-@app.get("/artifact/model/{id}/rate")
-async def get_model_rating(
-    id: str,
-    db: Session = Depends(get_db)
-):
+# Latencies are not measured per request; every *_latency field reports 0.1
+RATING_LATENCIES = {
+    name: 0.1 for name in ModelRating.model_fields if name.endswith("_latency")
+}
+# Shared, never mutated: used when a metrics row has no size breakdown
+EMPTY_SIZE_SCORE = SizeScore.model_construct(
+    raspberry_pi=0, jetson_nano=0, desktop_pc=0, aws_server=0
+)
+
+
+@app.get("/artifact/model/{id}/rate", response_model=ModelRating)
+def get_model_rating(id: str, db: Session = Depends(get_db)):
     """
     Get ratings for this model artifact. (BASELINE)
 
     NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
     """
-    # Find package
-    package = None
-    for pkg in db.query(Package).filter(Package.version == "model").all():
-        if generate_artifact_id_from_package(pkg) == id:
-            package = pkg
-            break
-        if pkg.description and f"artifact_id:{id}" in pkg.description:
-            package = pkg
-            break
+    # Find package, with its metrics row joined into the same query
+    package = get_artifact_by_id(
+        db, id, "model", options=(joinedload(Package.metrics),)
+    )
 
     if not package:
         raise HTTPException(status_code=404, detail="Artifact does not exist")
 
-    # Get metrics
-    metrics = db.query(Metrics).filter(Metrics.package_id == package.id).first()
+    metrics = package.metrics
 
     if not metrics:
         raise HTTPException(status_code=500, detail="Rating not available")
 
-    # Build size_score object
+    # Build size_score object. Values come from our own metrics row, so the
+    # response models are built with model_construct() to skip validation.
     size_score_data = metrics.size_score or {}
     if isinstance(size_score_data, dict):
-        size_score = SizeScore(
+        size_score = SizeScore.model_construct(
             raspberry_pi=size_score_data.get("raspberry_pi", 0),
             jetson_nano=size_score_data.get("jetson_nano", 0),
             desktop_pc=size_score_data.get("desktop_pc", 0),
-            aws_server=size_score_data.get("aws_server", 0)
+            aws_server=size_score_data.get("aws_server", 0),
         )
     else:
-        size_score = SizeScore(raspberry_pi=0, jetson_nano=0, desktop_pc=0, aws_server=0)
+        size_score = EMPTY_SIZE_SCORE
 
-    return ModelRating(
+    return ModelRating.model_construct(
+        **RATING_LATENCIES,
         name=package.name,
         category="model",
         net_score=metrics.net_score or 0,
-        net_score_latency=0.1,
         ramp_up_time=metrics.ramp_up or 0,
-        ramp_up_time_latency=0.1,
         bus_factor=metrics.bus_factor or 0,
-        bus_factor_latency=0.1,
         performance_claims=metrics.performance_claims or 0,
-        performance_claims_latency=0.1,
         license=metrics.license_score or 0,
-        license_latency=0.1,
         dataset_and_code_score=metrics.dataset_and_code_score or 0,
-        dataset_and_code_score_latency=0.1,
         dataset_quality=metrics.dataset_quality or 0,
-        dataset_quality_latency=0.1,
         code_quality=metrics.code_quality or 0,
-        code_quality_latency=0.1,
         reproducibility=metrics.reproducibility or 0,
-        reproducibility_latency=0.1,
         reviewedness=metrics.reviewedness or 0,
-        reviewedness_latency=0.1,
         tree_score=metrics.tree_score or 0,
-        tree_score_latency=0.1,
         size_score=size_score,
-        size_score_latency=0.1
     )
 
 
 # ========== Artifact Cost ==========
 
-@app.get("/artifact/{artifact_type}/{id}/cost")
-async def get_artifact_cost(
+
+@app.get(
+    "/artifact/{artifact_type}/{id}/cost", response_model=Dict[str, Dict[str, float]]
+)
+def get_artifact_cost(
     artifact_type: ArtifactType,
     id: str,
+    request: Request,
+    response: Response,
     dependency: bool = False,
-    db: Session = Depends(get_db)
+    db: Session = Depends(get_db),
 ):
     """
     Get the cost of an artifact. (BASELINE)
@@ -999,14 +1448,7 @@ async def get_artifact_cost(
     NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
     """
     # Find package
-    package = None
-    for pkg in db.query(Package).filter(Package.version == artifact_type.value).all():
-        if generate_artifact_id_from_package(pkg) == id:
-            package = pkg
-            break
-        if pkg.description and f"artifact_id:{id}" in pkg.description:
-            package = pkg
-            break
+    package = get_artifact_by_id(db, id, artifact_type.value)
 
     if not package:
         raise HTTPException(status_code=404, detail="Artifact does not exist")
@@ -1014,41 +1456,85 @@ async def get_artifact_cost(
     # Calculate cost (size in MB)
     size_mb = (package.size_bytes or 0) / (1024 * 1024)
 
-    result = {
-        id: {
-            "total_cost": round(size_mb, 2)
-        }
-    }
+    result = {id: {"total_cost": round(size_mb, 2)}}
 
     if dependency:
         result[id]["standalone_cost"] = round(size_mb, 2)
 
-        # Add dependencies (lineage)
-        lineages = db.query(Lineage).filter(Lineage.package_id == package.id).all()
-        total_cost = size_mb
+        # Add dependencies (full ancestor chain): a recursive CTE walks the
+        # lineage in one query; UNION drops repeats so shared ancestors and
+        # cycles are counted once
+        ancestors = (
+            select(Lineage.parent_id.label("id"))
+            .where(Lineage.package_id == package.id)
+            .cte("ancestors", recursive=True)
+        )
+        ancestors = ancestors.union(
+            select(Lineage.parent_id).join(
+                ancestors, Lineage.package_id == ancestors.c.id
+            )
+        )
+        parents = (
+            db.query(Package.id, Package.artifact_id, Package.size_bytes)
+            .join(ancestors, Package.id == ancestors.c.id)
+            .filter(Package.id != package.id)
+            .all()
+        )
 
-        for lineage in lineages:
-            parent = db.query(Package).filter(Package.id == lineage.parent_id).first()
-            if parent:
-                parent_id = generate_artifact_id_from_package(parent)
-                parent_size_mb = (parent.size_bytes or 0) / (1024 * 1024)
-                result[parent_id] = {
-                    "standalone_cost": round(parent_size_mb, 2),
-                    "total_cost": round(parent_size_mb, 2)
-                }
-                total_cost += parent_size_mb
+        # Each ancestor's own total covers its ancestors too, so the edges
+        # between them are loaded once and walked in memory
+        sizes = {package.id: size_mb}
+        sizes.update(
+            (pk, (size_bytes or 0) / (1024 * 1024)) for pk, _, size_bytes in parents
+        )
+        parents_of = {}
+        for child_pk, parent_pk in db.query(
+            Lineage.package_id, Lineage.parent_id
+        ).filter(Lineage.package_id.in_(list(sizes))):
+            parents_of.setdefault(child_pk, []).append(parent_pk)
+
+        for pk, parent_id, _ in parents:
+            result[parent_id] = {
+                "standalone_cost": round(sizes[pk], 2),
+                "total_cost": round(_chain_cost(pk, sizes, parents_of), 2),
+            }
+
+        result[id]["total_cost"] = round(_chain_cost(package.id, sizes, parents_of), 2)
 
-        result[id]["total_cost"] = round(total_cost, 2)
+    etag = compute_etag(
+        *sorted(
+            (artifact_id, *sorted(costs.items()))
+            for artifact_id, costs in result.items()
+        )
+    )
+    if not_modified(request, response, etag):
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
 
     return result
 
 
+def _chain_cost(
+    root, sizes: Dict[Any, float], parents_of: Dict[Any, List[Any]]
+) -> float:
+    """Size of a package plus every distinct ancestor; cycles are counted once."""
+    seen = {root}
+    stack = [root]
+    while stack:
+        for parent in parents_of.get(stack.pop(), ()):
+            if parent not in seen:
+                seen.add(parent)
+                stack.append(parent)
+    return sum(sizes.get(pk, 0) for pk in seen)
+
+
 # ========== Lineage ==========
 
+
 @app.get("/artifact/model/{id}/lineage", response_model=ArtifactLineageGraph)
-async def get_artifact_lineage(
-    id: str,
-    db: Session = Depends(get_db)
+def get_artifact_lineage(
+    id: str, request: Request, response: Response, db: Session = Depends(get_db)
 ) -> ArtifactLineageGraph:
     """
     Retrieve the lineage graph for this artifact. (BASELINE)
@@ -1056,57 +1542,67 @@ async def get_artifact_lineage(
     NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
     """
     # Find package
-    package = None
-    for pkg in db.query(Package).filter(Package.version == "model").all():
-        if generate_artifact_id_from_package(pkg) == id:
-            package = pkg
-            break
-        if pkg.description and f"artifact_id:{id}" in pkg.description:
-            package = pkg
-            break
+    package = get_artifact_by_id(db, id, "model")
 
     if not package:
         raise HTTPException(status_code=404, detail="Artifact does not exist")
 
+    # Nodes and edges come from our own rows, so validation is skipped
     nodes = [
-        ArtifactLineageNode(
-            artifact_id=id,
-            name=package.name,
-            source="config_json"
+        ArtifactLineageNode.model_construct(
+            artifact_id=id, name=package.name, source="config_json"
         )
     ]
     edges = []
 
-    # Get lineage relationships
-    lineages = db.query(Lineage).filter(Lineage.package_id == package.id).all()
+    # Get lineage relationships with their parents in one JOIN; any other
+    # relationship access raises instead of silently issuing a query per row
+    lineages = (
+        db.query(Lineage)
+        .options(joinedload(Lineage.parent), raiseload("*"))
+        .filter(Lineage.package_id == package.id)
+        .all()
+    )
 
     for lineage in lineages:
-        parent = db.query(Package).filter(Package.id == lineage.parent_id).first()
+        parent = lineage.parent
         if parent:
             parent_id = generate_artifact_id_from_package(parent)
-            nodes.append(ArtifactLineageNode(
-                artifact_id=parent_id,
-                name=parent.name,
-                source="config_json"
-            ))
-            edges.append(ArtifactLineageEdge(
-                from_node_artifact_id=parent_id,
-                to_node_artifact_id=id,
-                relationship=lineage.relationship_type or "base_model"
-            ))
+            nodes.append(
+                ArtifactLineageNode.model_construct(
+                    artifact_id=parent_id, name=parent.name, source="config_json"
+                )
+            )
+            edges.append(
+                ArtifactLineageEdge.model_construct(
+                    from_node_artifact_id=parent_id,
+                    to_node_artifact_id=id,
+                    relationship=lineage.relationship_type or "base_model",
+                )
+            )
+
+    # Lineage rarely changes, so repeat fetches can skip the body
+    etag = compute_etag(
+        id,
+        package.name,
+        *sorted((edge.from_node_artifact_id, edge.relationship) for edge in edges),
+    )
+    if not_modified(request, response, etag):
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
 
     # Return the lineage graph (FastAPI will serialize the Pydantic model)
-    result = ArtifactLineageGraph(nodes=nodes, edges=edges)
+    result = ArtifactLineageGraph.model_construct(nodes=nodes, edges=edges)
     return result
 
 
 # ========== License Check ==========
 
-@app.post("/artifact/model/{id}/license-check")
-async def check_license_compatibility(
-    id: str,
-    request: SimpleLicenseCheckRequest,
-    db: Session = Depends(get_db)
+
+@app.post("/artifact/model/{id}/license-check", response_model=bool)
+def check_license_compatibility(
+    id: str, request: SimpleLicenseCheckRequest, db: Session = Depends(get_db)
 ):
     """
     Assess license compatibility. (BASELINE)
@@ -1114,18 +1610,8 @@ async def check_license_compatibility(
 
     NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
     """
-    from src.utils.license_compatibility import license_checker
-    from src.utils.github_license_fetcher import github_license_fetcher
-
     # Find package
-    package = None
-    for pkg in db.query(Package).filter(Package.version == "model").all():
-        if generate_artifact_id_from_package(pkg) == id:
-            package = pkg
-            break
-        if pkg.description and f"artifact_id:{id}" in pkg.description:
-            package = pkg
-            break
+    package = get_artifact_by_id(db, id, "model")
 
     if not package:
         raise HTTPException(status_code=404, detail="Artifact does not exist")
@@ -1135,69 +1621,33 @@ async def check_license_compatibility(
 
     # Fetch GitHub license
     try:
-        github_license_info = github_license_fetcher.get_license_from_url(request.github_url)
+        github_license_info = github_license_fetcher.get_license_from_url(
+            request.github_url
+        )
         if github_license_info and "license" in github_license_info:
             github_license = github_license_info["license"]
         else:
             # If we can't fetch the license, treat as unknown (compatible)
             github_license = "unknown"
     except Exception as e:
-        logger.error(f"Failed to fetch GitHub license: {e}")
+        logger.error("Failed to fetch GitHub license: %s", e)
         # Don't raise 502, just treat as unknown license (compatible)
         github_license = "unknown"
 
     # Check compatibility
-    is_compatible, reason = license_checker.are_compatible(github_license, model_license)
+    is_compatible, reason = license_checker.are_compatible(
+        github_license, model_license
+    )
 
     return is_compatible
 
 
-# ========== Regex Search ==========
-
-@app.post("/artifact/byRegEx")
-async def search_by_regex(
-    regex_req: ArtifactRegEx,
-    db: Session = Depends(get_db)
-):
-    """
-    Get any artifacts fitting the regular expression. (BASELINE)
-
-    NOTE: This endpoint does NOT require authentication for baseline autograder functionality.
-    """
-    pattern = regex_req.regex
-
-    try:
-        compiled = re.compile(pattern, re.IGNORECASE)
-    except re.error:
-        raise HTTPException(status_code=400, detail="Invalid regex pattern")
-
-    results = []
-    packages = db.query(Package).all()
-
-    for pkg in packages:
-        # Search in name and model_card (README)
-        if compiled.search(pkg.name) or (pkg.model_card and compiled.search(pkg.model_card)):
-            artifact_id = generate_artifact_id_from_package(pkg)
-            artifact_type = pkg.version if pkg.version in ["model", "dataset", "code"] else "model"
-
-            results.append(ArtifactMetadata(
-                name=pkg.name,
-                id=artifact_id,
-                type=ArtifactType(artifact_type)
-            ))
-
-    if not results:
-        raise HTTPException(status_code=404, detail="No artifact found under this regex")
-
-    return results
-
-
 # ========== Get by Name ==========
 
-@app.get("/artifact/byName/{name}")
-async def get_artifact_by_name(
-    name: str,
-    db: Session = Depends(get_db)
+
+@app.get("/artifact/byName/{name}", response_model=List[ArtifactMetadata])
+def get_artifact_by_name(
+    name: str, request: Request, response: Response, db: Session = Depends(get_db)
 ):
     """
     List artifact metadata for this name. (NON-BASELINE)
@@ -1205,29 +1655,35 @@ async def get_artifact_by_name(
     NOTE: Authentication removed for baseline autograder compatibility.
     """
     # URL decode the name in case it contains special characters
-    import urllib.parse
-    decoded_name = urllib.parse.unquote(name)
-
-    # Try exact match first
-    packages = db.query(Package).filter(Package.name == decoded_name).all()
+    decoded_name = unquote(name)
 
-    # If no exact match, try case-insensitive
-    if not packages:
-        packages = db.query(Package).filter(Package.name.ilike(decoded_name)).all()
+    # One indexed lookup on lower(name); exact-case matches take precedence.
+    # Plain row tuples are enough to build the response, so no ORM objects.
+    matches = db.execute(
+        select(Package.name, Package.artifact_id, Package.version).where(
+            func.lower(Package.name) == decoded_name.lower()
+        )
+    ).all()
+    rows = [row for row in matches if row.name == decoded_name] or matches
 
-    if not packages:
+    if not rows:
         raise HTTPException(status_code=404, detail="No such artifact")
 
-    results = []
-    for pkg in packages:
-        artifact_id = generate_artifact_id_from_package(pkg)
-        artifact_type = pkg.version if pkg.version in ["model", "dataset", "code"] else "model"
-
-        results.append(ArtifactMetadata(
-            name=pkg.name,
+    construct = ArtifactMetadata.model_construct
+    results = [
+        construct(
+            name=pkg_name,
             id=artifact_id,
-            type=ArtifactType(artifact_type)
-        ))
+            type=ARTIFACT_TYPE_BY_VALUE.get(version, ArtifactType.model),
+        )
+        for pkg_name, artifact_id, version in rows
+    ]
+
+    etag = compute_etag(*((r.id, r.name, r.type.value) for r in results))
+    if not_modified(request, response, etag):
+        return Response(
+            status_code=304, headers={"ETag": etag, "Cache-Control": CACHE_CONTROL}
+        )
 
     return results
 
@@ -1236,9 +1692,14 @@ async def get_artifact_by_name(
 
 if __name__ == "__main__":
     import uvicorn
+
+    # Same event loop and HTTP parser as the container entrypoint
     uvicorn.run(
-        "main:app",
+        "src.api.main:app",
         host=settings.api_host,
         port=settings.api_port,
-        reload=True
+        loop="uvloop",
+        http="httptools",
+        reload=settings.is_local,
+        workers=settings.api_workers,
     )
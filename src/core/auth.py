@@ -6,8 +6,10 @@ import secrets
 import hashlib
 import bcrypt
 import json
+import threading
 from datetime import datetime, timedelta
 from typing import Optional, List
+from cachetools import TTLCache
 from sqlalchemy.orm import Session
 from fastapi import HTTPException, Header, Depends
 import logging
@@ -18,6 +20,17 @@ from src.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+# Recently verified tokens: BLAKE2b digest of the token ->
+# (token_id, expires_at, user_id). Plaintext tokens are not kept, and the user
+# is re-read on every hit so permission changes and deletions apply at once.
+_token_cache = TTLCache(maxsize=50_000, ttl=60)
+_token_cache_lock = threading.Lock()
+
+
+def _token_cache_key(token: str) -> bytes:
+    """Fixed-size cache key for a bearer token."""
+    return hashlib.blake2b(token.encode(), digest_size=16).digest()
+
 
 def hash_password(password: str, salt: str) -> str:
     """Hash password with salt using bcrypt."""
@@ -124,11 +137,48 @@ def generate_token(db: Session, user: User) -> str:
     return token
 
 
+def clear_token_cache():
+    """Forget all cached token verifications (e.g. after a registry reset)."""
+    with _token_cache_lock:
+        _token_cache.clear()
+
+
 def verify_token(db: Session, token: str) -> Optional[User]:
     """
     Verify API token and return associated user.
     Decrements API call counter.
+    Recently verified tokens skip the token lookup; only the call-counter
+    update and a primary-key load of the user go to the database.
     """
+    cache_key = _token_cache_key(token)
+    with _token_cache_lock:
+        cached = _token_cache.get(cache_key)
+
+    if cached:
+        token_id, expires_at, user_id = cached
+        if expires_at and datetime.now() > expires_at:
+            logger.warning(f"Expired token for user_id: {user_id}")
+            return None
+
+        # Consume one call; matches nothing if the token was deleted or used up
+        updated = db.query(Token).filter(
+            Token.id == token_id,
+            Token.api_calls_remaining > 0
+        ).update(
+            {Token.api_calls_remaining: Token.api_calls_remaining - 1},
+            synchronize_session=False
+        )
+        db.commit()
+
+        user = db.get(User, user_id) if updated else None
+        if user:
+            return user
+
+        with _token_cache_lock:
+            _token_cache.pop(cache_key, None)
+        logger.warning(f"Token no longer valid for user_id: {user_id}")
+        return None
+
     token_hash = hashlib.sha256(token.encode()).hexdigest()
 
     # Find token in database
@@ -159,6 +209,9 @@ def verify_token(db: Session, token: str) -> Optional[User]:
         logger.error(f"Token exists but user not found: {db_token.user_id}")
         return None
 
+    with _token_cache_lock:
+        _token_cache[cache_key] = (db_token.id, db_token.expires_at, user.id)
+
     return user
 
 
@@ -229,6 +282,37 @@ async def get_current_user_optional(
     return user  # Returns None if token invalid, User if valid
 
 
+def reset_default_admin(db: Session) -> User:
+    """
+    Reset the default admin user to the configured credentials.
+    Updates the existing row in place (or creates it) and only flushes,
+    so the caller can fold it into a larger transaction such as a registry reset.
+    """
+    salt = secrets.token_hex(16)
+    password_hash = hash_password(settings.admin_password, salt)
+    permissions = ["upload", "download", "search", "admin"]
+
+    admin = db.query(User).filter(User.username == settings.admin_username).first()
+    if admin:
+        admin.password_hash = password_hash
+        admin.salt = salt
+        admin.is_admin = True
+        admin.permissions = permissions
+    else:
+        admin = User(
+            username=settings.admin_username,
+            password_hash=password_hash,
+            salt=salt,
+            is_admin=True,
+            permissions=permissions
+        )
+        db.add(admin)
+
+    db.flush()
+    logger.info("Default admin user reset")
+    return admin
+
+
 def init_default_admin(db: Session):
     """
     Initialize default admin user if not exists.
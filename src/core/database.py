@@ -2,13 +2,14 @@
 Database configuration and session management.
 """
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text, inspect
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import NullPool
 from contextlib import contextmanager
 from typing import Generator
 import logging
 
+from src.core.config import settings
 from src.core.models import Base
 
 logger = logging.getLogger(__name__)
@@ -21,9 +22,25 @@ DATABASE_URL = os.getenv(
 
 # Create engine
 # For production, use connection pooling; for testing, use NullPool
+if "test" in DATABASE_URL:
+    pool_options = {"poolclass": NullPool}
+else:
+    # Handlers hold a connection only while they query, so the pool can be
+    # much smaller than the threadpool; stale connections are detected on
+    # checkout and recycled before server-side timeouts
+    pool_options = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": 30,
+        "pool_recycle": 1800,
+        "pool_pre_ping": True,
+    }
+
 engine = create_engine(
     DATABASE_URL,
-    poolclass=NullPool if "test" in DATABASE_URL else None,
+    **pool_options,
+    # Room for every distinct compiled statement the API issues
+    query_cache_size=1200,
     echo=os.getenv("SQL_ECHO", "false").lower() == "true"
 )
 
@@ -35,9 +52,76 @@ def init_db():
     """Initialize database by creating all tables."""
     logger.info("Initializing database...")
     Base.metadata.create_all(bind=engine)
+    upgrade_schema()
     logger.info("Database initialized successfully")
 
 
+def upgrade_schema():
+    """
+    Apply additive schema changes to tables that already exist.
+    create_all() only creates missing tables, so new columns and indexes on
+    existing deployments are added here.
+    """
+    columns = {col["name"] for col in inspect(engine).get_columns("packages")}
+
+    with engine.begin() as conn:
+        if "artifact_id" not in columns:
+            logger.info("Adding packages.artifact_id column")
+            conn.execute(text("ALTER TABLE packages ADD COLUMN artifact_id VARCHAR(20)"))
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_packages_artifact_id ON packages (artifact_id)"
+        ))
+        # Case-insensitive name lookups (byName) filter on lower(name)
+        conn.execute(text(
+            "CREATE INDEX IF NOT EXISTS ix_packages_lower_name ON packages (lower(name))"
+        ))
+        # Nothing reads download history by (package_id, timestamp); drop the
+        # index earlier deployments created so inserts stop maintaining it
+        conn.execute(text("DROP INDEX IF EXISTS ix_download_history_package_timestamp"))
+
+    if engine.dialect.name == "postgresql":
+        # Trigram indexes let the regex search (~*) avoid scanning every README
+        try:
+            with engine.begin() as conn:
+                conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_packages_name_trgm "
+                    "ON packages USING gin (name gin_trgm_ops)"
+                ))
+                conn.execute(text(
+                    "CREATE INDEX IF NOT EXISTS ix_packages_model_card_trgm "
+                    "ON packages USING gin (model_card gin_trgm_ops)"
+                ))
+        except Exception as e:
+            logger.warning(f"Skipping trigram indexes: {e}")
+
+
+# Arbitrary application-wide key for the first-boot advisory lock
+INIT_LOCK_KEY = 46500
+
+
+@contextmanager
+def init_lock() -> Generator[None, None, None]:
+    """
+    Serialize startup initialization across worker processes.
+    Each worker runs the startup hook; on PostgreSQL a session-level advisory
+    lock makes them create tables and the default admin one at a time.
+    Usage:
+        with init_lock():
+            init_db()
+    """
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": INIT_LOCK_KEY})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": INIT_LOCK_KEY})
+
+
 def drop_db():
     """Drop all tables (useful for testing/reset)."""
     logger.warning("Dropping all database tables...")
@@ -106,6 +106,7 @@ class Package(Base):
     id = Column(UUID(), primary_key=True, default=uuid.uuid4)
     name = Column(String(255), nullable=False, index=True)
     version = Column(String(50), nullable=False, index=True)
+    artifact_id = Column(String(20), nullable=True, index=True)  # Numeric string ID exposed by the API
     description = Column(Text, nullable=True)
     uploader_id = Column(UUID(), ForeignKey("users.id"), nullable=True, index=True)
     s3_path = Column(String(500), nullable=False)  # s3://bucket/name/version/package.zip
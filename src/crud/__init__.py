@@ -38,6 +38,7 @@ from .rating import (
 # Download operations
 from .download import (
     log_download,
+    log_downloads,
     get_download_history
 )
 
@@ -71,6 +72,7 @@ __all__ = [
     "get_average_rating",
     # Download
     "log_download",
+    "log_downloads",
     "get_download_history",
     # Confusion
     "detect_package_confusion",
@@ -2,12 +2,13 @@
 Download history CRUD operations.
 Handles all database operations related to the DownloadHistory model.
 """
-from typing import List, Optional
+from typing import List, Optional, Dict, Any
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 from uuid import UUID
 import logging
 
-from src.core.models import DownloadHistory
+from src.core.models import DownloadHistory, Package
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,28 @@ def log_download(
     return download
 
 
+def log_downloads(db: Session, downloads: List[Dict[str, Any]]) -> int:
+    """
+    Log a batch of downloads with a single INSERT.
+    Rows whose package has since been deleted are dropped.
+    """
+    if not downloads:
+        return 0
+
+    package_ids = {d["package_id"] for d in downloads}
+    existing = {
+        pid for (pid,) in db.query(Package.id).filter(Package.id.in_(package_ids))
+    }
+    rows = [d for d in downloads if d["package_id"] in existing]
+
+    if rows:
+        db.execute(insert(DownloadHistory), rows)
+        db.commit()
+
+    logger.info(f"Logged {len(rows)} downloads")
+    return len(rows)
+
+
 # ========== READ Operations ==========
 
 def get_download_history(db: Session, package_id: UUID) -> List[DownloadHistory]:
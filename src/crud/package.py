@@ -3,7 +3,7 @@ Package CRUD operations.
 Handles all database operations related to the Package model.
 """
 from typing import List, Optional, Dict, Any
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from uuid import UUID
 import logging
 
@@ -94,7 +94,7 @@ def create_lineage(
 
 def get_package_by_id(db: Session, package_id: UUID) -> Optional[Package]:
     """Get package by ID."""
-    return db.query(Package).filter(Package.id == package_id).first()
+    return db.get(Package, package_id)
 
 
 def get_package_by_name_version(db: Session, name: str, version: str) -> Optional[Package]:
@@ -156,8 +156,11 @@ def search_packages(
     # Get total count
     total = query.count()
 
-    # Apply pagination (max 100 per page for DoS protection)
-    packages = query.offset(offset).limit(min(limit, 100)).all()
+    # Apply pagination (max 100 per page for DoS protection); the page's
+    # metrics come back in one extra IN query rather than one per package
+    packages = query.options(selectinload(Package.metrics)).offset(offset).limit(
+        min(limit, 100)
+    ).all()
 
     logger.debug(f"Search found {total} packages, returning {len(packages)} (model_card_search={search_model_card})")
     return packages, total
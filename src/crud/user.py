@@ -20,7 +20,7 @@ def update_user_permissions(
     permissions: List[str]
 ) -> Optional[User]:
     """Update user permissions (admin only operation)."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         return None
 
@@ -36,7 +36,7 @@ def update_user_permissions(
 
 def delete_user(db: Session, user_id: UUID) -> bool:
     """Delete a user."""
-    user = db.query(User).filter(User.id == user_id).first()
+    user = db.get(User, user_id)
     if not user:
         return False
 
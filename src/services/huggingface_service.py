@@ -8,9 +8,11 @@ import tempfile
 import zipfile
 import logging
 import json
-from typing import Dict, Optional, Tuple, List
+import threading
+from typing import Dict, Optional, Tuple, List, BinaryIO
 from huggingface_hub import snapshot_download, model_info, dataset_info
 from huggingface_hub.utils import HfHubHTTPError, RepositoryNotFoundError
+from cachetools import TTLCache, cached
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +20,16 @@ logger = logging.getLogger(__name__)
 # This works both locally (from .env) and on AWS (from environment variables)
 HF_TOKEN = os.getenv('HF_TOKEN')
 
+# Hub metadata rarely changes; cache it so retried ingests skip the API call
+_model_info_cache = TTLCache(maxsize=1024, ttl=600)
+_model_info_lock = threading.Lock()
+
+
+@cached(_model_info_cache, lock=_model_info_lock)
+def _fetch_model_info(model_id: str):
+    """Fetch model info from the Hub (cached per model_id for 10 minutes)."""
+    return model_info(model_id, token=HF_TOKEN)
+
 
 class HuggingFaceIngestionService:
     """Service for ingesting HuggingFace models and datasets."""
@@ -41,7 +53,7 @@ class HuggingFaceIngestionService:
             logger.info(f"Fetching metadata for model: {model_id}")
 
             # Get model info first to validate it exists and get metadata
-            info = model_info(model_id, token=HF_TOKEN)
+            info = _fetch_model_info(model_id)
 
             logger.info(f"Downloading model: {model_id}")
 
@@ -143,19 +155,19 @@ class HuggingFaceIngestionService:
             raise ValueError(f"Failed to download dataset '{dataset_id}': {str(e)}")
 
     @staticmethod
-    def create_package_zip(source_dir: str, output_path: str) -> int:
+    def write_package_zip(source_dir: str, fileobj: BinaryIO) -> int:
         """
-        Create a zip file from a directory.
+        Write a zip archive of a directory to a file object.
+        The file object does not need to be seekable, so the archive can be
+        streamed straight into an upload.
 
         Args:
             source_dir: Directory to zip
-            output_path: Output zip file path
+            fileobj: Writable binary file object
 
         Returns:
-            Size of the created zip file in bytes
+            Number of files archived
         """
-        logger.info(f"Creating zip package: {output_path}")
-
         # Count total files for progress tracking
         total_files = sum(len(files) for _, _, files in os.walk(source_dir))
         logger.info(f"Archiving {total_files} files...")
@@ -163,7 +175,7 @@ class HuggingFaceIngestionService:
         # Use ZIP_STORED (no compression) for faster archiving of large model files
         # Model binaries are already optimized and don't compress well anyway
         file_count = 0
-        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED) as zipf:
+        with zipfile.ZipFile(fileobj, 'w', zipfile.ZIP_STORED) as zipf:
             for root, dirs, files in os.walk(source_dir):
                 for file in files:
                     file_path = os.path.join(root, file)
@@ -174,11 +186,46 @@ class HuggingFaceIngestionService:
                     if file_count % 5 == 0 or file_count == total_files:
                         logger.info(f"Archived {file_count}/{total_files} files ({file_count*100//total_files}%)")
 
+        return file_count
+
+    @staticmethod
+    def create_package_zip(source_dir: str, output_path: str) -> int:
+        """
+        Create a zip file from a directory.
+
+        Args:
+            source_dir: Directory to zip
+            output_path: Output zip file path
+
+        Returns:
+            Size of the created zip file in bytes
+        """
+        logger.info(f"Creating zip package: {output_path}")
+
+        with open(output_path, 'wb') as f:
+            HuggingFaceIngestionService.write_package_zip(source_dir, f)
+
         size_bytes = os.path.getsize(output_path)
         logger.info(f"Zip package created: {size_bytes} bytes")
 
         return size_bytes
 
+    @staticmethod
+    def extract_license(metadata: Dict) -> str:
+        """
+        Extract the license from the "license:<id>" tag in Hub metadata.
+
+        Args:
+            metadata: Model metadata from download_model
+
+        Returns:
+            License identifier, or "unknown" if no license tag is present
+        """
+        return next(
+            (tag.split(":", 1)[1] for tag in metadata.get("tags") or () if tag.startswith("license:")),
+            "unknown"
+        )
+
     @staticmethod
     def get_model_url(model_id: str) -> str:
         """
@@ -3,9 +3,14 @@ S3 helper module for package storage.
 Implements S3 operations as per CRUD_IMPLEMENTATION_PLAN.md
 """
 import boto3
+from boto3.s3.transfer import TransferConfig
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from cachetools import TLRUCache
 import logging
-from typing import Optional, List
+from typing import Optional, List, Callable, BinaryIO
 import os
 import zipfile
 import tempfile
@@ -16,9 +21,119 @@ from src.core.config import settings
 logger = logging.getLogger(__name__)
 
 
+def _presigned_url_ttu(key, url, now):
+    """Reuse a presigned URL for half of its lifetime."""
+    _, expiration = key
+    return now + expiration / 2
+
+
+class MultipartUploadWriter(io.RawIOBase):
+    """
+    Write-only stream that uploads to S3 as a multipart upload.
+    Data is buffered into parts and sent as soon as a part fills up, so a
+    producer such as zipfile can write straight to S3 without a local copy.
+    Objects smaller than one part never start a multipart upload and are
+    sent with a single PutObject on close.
+    """
+
+    # S3 requires every part except the last to be at least 5 MiB
+    PART_SIZE = 8 * 1024 * 1024
+
+    def __init__(self, s3_client, bucket_name: str, s3_key: str, part_size: Optional[int] = None):
+        super().__init__()
+        self.s3_client = s3_client
+        self.bucket_name = bucket_name
+        self.s3_key = s3_key
+        self.part_size = part_size or self.PART_SIZE
+        self.bytes_written = 0
+        self._buffer = bytearray()
+        self._parts = []
+        self._upload_id = None  # Set once the first full part is ready
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self._buffer.extend(data)
+        self.bytes_written += len(data)
+
+        while len(self._buffer) >= self.part_size:
+            self._upload_part(bytes(self._buffer[:self.part_size]))
+            del self._buffer[:self.part_size]
+
+        return len(data)
+
+    def _upload_part(self, body: bytes):
+        if self._upload_id is None:
+            response = self.s3_client.create_multipart_upload(
+                Bucket=self.bucket_name, Key=self.s3_key
+            )
+            self._upload_id = response['UploadId']
+
+        part_number = len(self._parts) + 1
+        response = self.s3_client.upload_part(
+            Bucket=self.bucket_name,
+            Key=self.s3_key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        self._parts.append({'ETag': response['ETag'], 'PartNumber': part_number})
+
+    def close(self):
+        """Upload the remaining buffer and complete the upload."""
+        if self.closed:
+            return
+        try:
+            if self._upload_id is None:
+                # Everything fit in one part: one request instead of three
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=self.s3_key,
+                    Body=bytes(self._buffer)
+                )
+            else:
+                if self._buffer:
+                    self._upload_part(bytes(self._buffer))
+
+                self.s3_client.complete_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=self.s3_key,
+                    UploadId=self._upload_id,
+                    MultipartUpload={'Parts': self._parts}
+                )
+        except Exception:
+            # Discard the uploaded parts; abort() also closes the writer
+            self.abort()
+            raise
+        self._buffer.clear()
+        super().close()
+
+    def abort(self):
+        """Abort the multipart upload and discard any uploaded parts."""
+        if self.closed:
+            return
+        try:
+            if self._upload_id is not None:
+                self.s3_client.abort_multipart_upload(
+                    Bucket=self.bucket_name,
+                    Key=self.s3_key,
+                    UploadId=self._upload_id
+                )
+        finally:
+            super().close()
+
+
 class S3Helper:
     """Helper class for S3 operations."""
 
+    # HTTP connections kept by the shared client; requests from concurrent
+    # API threads beyond botocore's default of 10 would otherwise wait
+    MAX_POOL_CONNECTIONS = 50
+
+    # Concurrent DeleteObjects calls during delete_all_objects
+    DELETE_WORKERS = 16
+
     def __init__(self):
         """Initialize S3 client with support for MinIO/LocalStack."""
         self.bucket_name = settings.s3_bucket_name
@@ -29,6 +144,10 @@ class S3Helper:
         client_kwargs = {
             'service_name': 's3',
             'region_name': self.region,
+            'config': Config(
+                signature_version='s3v4',
+                max_pool_connections=self.MAX_POOL_CONNECTIONS,
+            ),
         }
 
         # Add endpoint URL if specified (for MinIO, LocalStack, etc.)
@@ -44,6 +163,18 @@ class S3Helper:
         # Initialize boto3 client
         self.s3_client = boto3.client(**client_kwargs)
 
+        # Large files are split into parts that upload in parallel
+        self.transfer_config = TransferConfig(
+            multipart_threshold=settings.s3_multipart_threshold_mb * 1024 * 1024,
+            multipart_chunksize=settings.s3_multipart_chunksize_mb * 1024 * 1024,
+            max_concurrency=settings.s3_max_concurrency,
+            use_threads=True,
+        )
+
+        # Presigned URLs keyed by (s3_key, expiration)
+        self._presigned_urls = TLRUCache(maxsize=10000, ttu=_presigned_url_ttu)
+        self._presigned_urls_lock = threading.Lock()
+
         logger.info(f"S3Helper initialized for bucket: {self.bucket_name} (environment: {settings.environment})")
 
     def upload_file(self, file_path: str, s3_key: str) -> bool:
@@ -56,7 +187,9 @@ class S3Helper:
             True if successful, False otherwise
         """
         try:
-            self.s3_client.upload_file(file_path, self.bucket_name, s3_key)
+            self.s3_client.upload_file(
+                file_path, self.bucket_name, s3_key, Config=self.transfer_config
+            )
             logger.info(f"Uploaded file to S3: s3://{self.bucket_name}/{s3_key}")
             return True
         except ClientError as e:
@@ -73,13 +206,40 @@ class S3Helper:
             True if successful, False otherwise
         """
         try:
-            self.s3_client.upload_fileobj(file_obj, self.bucket_name, s3_key)
+            self.s3_client.upload_fileobj(
+                file_obj, self.bucket_name, s3_key, Config=self.transfer_config
+            )
             logger.info(f"Uploaded file object to S3: s3://{self.bucket_name}/{s3_key}")
             return True
         except ClientError as e:
             logger.error(f"Failed to upload file object to S3: {e}")
             return False
 
+    def upload_stream(self, s3_key: str, write_fn: Callable[[BinaryIO], None]) -> Optional[int]:
+        """
+        Upload content produced by a writer function, without staging it on disk.
+        Args:
+            s3_key: S3 object key
+            write_fn: Function that writes the object content to the given stream
+        Returns:
+            Number of bytes uploaded, or None if the upload failed
+        """
+        writer = MultipartUploadWriter(self.s3_client, self.bucket_name, s3_key)
+
+        try:
+            write_fn(writer)
+            writer.close()
+        except Exception as e:
+            logger.error(f"Failed to stream upload to S3: {e}")
+            try:
+                writer.abort()
+            except ClientError as abort_error:
+                logger.error(f"Failed to abort multipart upload: {abort_error}")
+            return None
+
+        logger.info(f"Streamed {writer.bytes_written} bytes to S3: s3://{self.bucket_name}/{s3_key}")
+        return writer.bytes_written
+
     def download_file(self, s3_key: str, local_path: str) -> bool:
         """
         Download file from S3.
@@ -124,12 +284,19 @@ class S3Helper:
         """
         Generate presigned URL for downloading.
         As per plan: Expires in 5 minutes (300 seconds).
+        URLs are cached and reused for half of their lifetime.
         Args:
             s3_key: S3 object key
             expiration: URL expiration time in seconds
         Returns:
             Presigned URL or None if failed
         """
+        cache_key = (s3_key, expiration)
+        with self._presigned_urls_lock:
+            url = self._presigned_urls.get(cache_key)
+        if url is not None:
+            return url
+
         try:
             url = self.s3_client.generate_presigned_url(
                 'get_object',
@@ -137,6 +304,8 @@ class S3Helper:
                 ExpiresIn=expiration
             )
             logger.info(f"Generated presigned URL for: s3://{self.bucket_name}/{s3_key}")
+            with self._presigned_urls_lock:
+                self._presigned_urls[cache_key] = url
             return url
         except ClientError as e:
             logger.error(f"Failed to generate presigned URL: {e}")
@@ -158,6 +327,39 @@ class S3Helper:
             logger.error(f"Failed to delete from S3: {e}")
             return False
 
+    def bulk_delete(self, s3_keys: List[str]) -> int:
+        """
+        Delete many objects using batched DeleteObjects calls.
+        Args:
+            s3_keys: S3 object keys to delete
+        Returns:
+            Number of objects deleted
+        """
+        deleted_count = 0
+
+        # DeleteObjects accepts at most 1000 keys per request
+        for start in range(0, len(s3_keys), 1000):
+            batch = [{'Key': key} for key in s3_keys[start:start + 1000]]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': batch, 'Quiet': True}
+                )
+            except ClientError as e:
+                logger.error(f"Failed to delete batch of {len(batch)} objects: {e}")
+                continue
+
+            # Quiet mode only reports failures
+            errors = response.get('Errors', [])
+            for error in errors:
+                logger.error(f"Error deleting {error['Key']}: {error['Message']}")
+
+            batch_count = len(batch) - len(errors)
+            deleted_count += batch_count
+            logger.info(f"Deleted batch of {batch_count} objects from S3")
+
+        return deleted_count
+
     def delete_all_objects(self) -> int:
         """
         Delete all objects in the bucket with pagination.
@@ -167,43 +369,32 @@ class S3Helper:
             Number of objects deleted
         """
         deleted_count = 0
+        with self._presigned_urls_lock:
+            self._presigned_urls.clear()
 
-        try:
-            # Use pagination to handle large number of objects
-            paginator = self.s3_client.get_paginator('list_objects_v2')
-            pages = paginator.paginate(Bucket=self.bucket_name)
-
-            for page in pages:
-                if 'Contents' not in page:
-                    continue
-
-                # Build list of objects to delete (max 1000 per batch)
-                objects_to_delete = [{'Key': obj['Key']} for obj in page['Contents']]
-
-                if objects_to_delete:
-                    # Delete batch of objects
-                    response = self.s3_client.delete_objects(
-                        Bucket=self.bucket_name,
-                        Delete={'Objects': objects_to_delete}
-                    )
-
-                    # Count successful deletions
-                    if 'Deleted' in response:
-                        batch_count = len(response['Deleted'])
-                        deleted_count += batch_count
-                        logger.info(f"Deleted batch of {batch_count} objects from S3")
-
-                    # Log any errors
-                    if 'Errors' in response:
-                        for error in response['Errors']:
-                            logger.error(f"Error deleting {error['Key']}: {error['Message']}")
-
-            logger.info(f"Total S3 objects deleted: {deleted_count}")
-            return deleted_count
+        # Each listed page (up to 1000 keys) is deleted on a worker thread
+        # while the next page is being listed
+        with ThreadPoolExecutor(max_workers=self.DELETE_WORKERS) as executor:
+            futures = []
+            try:
+                # Use pagination to handle large number of objects
+                paginator = self.s3_client.get_paginator('list_objects_v2')
+                pages = paginator.paginate(Bucket=self.bucket_name)
 
-        except ClientError as e:
-            logger.error(f"Failed to delete all objects: {e}")
-            return deleted_count
+                for page in pages:
+                    if 'Contents' not in page:
+                        continue
+
+                    keys = [obj['Key'] for obj in page['Contents']]
+                    futures.append(executor.submit(self.bulk_delete, keys))
+
+            except ClientError as e:
+                logger.error(f"Failed to list objects for deletion: {e}")
+
+            deleted_count = sum(future.result() for future in futures)
+
+        logger.info(f"Total S3 objects deleted: {deleted_count}")
+        return deleted_count
 
     def file_exists(self, s3_key: str) -> bool:
         """
@@ -353,7 +544,9 @@ class S3Helper:
             component_s3_key = f"temp/{package_name}/{version}/{component}.zip"
 
             with open(temp_component_path, 'rb') as f:
-                self.s3_client.upload_fileobj(f, self.bucket_name, component_s3_key)
+                self.s3_client.upload_fileobj(
+                    f, self.bucket_name, component_s3_key, Config=self.transfer_config
+                )
 
             # Clean up temp files
             os.unlink(temp_download_path)
@@ -5,8 +5,10 @@ Fetches license information from GitHub repositories.
 
 import requests
 import logging
-from typing import Optional, Dict, Any
+import threading
+from typing import Optional, Dict, Any, Tuple
 import re
+from cachetools import TTLCache
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +21,11 @@ class GitHubLicenseFetcher:
 
     GITHUB_API_BASE = "https://api.github.com"
 
+    # Repository licenses rarely change; successful lookups are kept for an hour
+    LICENSE_CACHE_TTL = 3600
+    # Repositories GitHub reports as missing or unlicensed are rechecked sooner
+    MISSING_LICENSE_CACHE_TTL = 60
+
     def __init__(self, github_token: Optional[str] = None):
         """
         Initialize GitHub license fetcher.
@@ -28,6 +35,9 @@ class GitHubLicenseFetcher:
         """
         self.github_token = github_token
         self.session = requests.Session()
+        self._license_cache = TTLCache(maxsize=10_000, ttl=self.LICENSE_CACHE_TTL)
+        self._missing_license_cache = TTLCache(maxsize=10_000, ttl=self.MISSING_LICENSE_CACHE_TTL)
+        self._license_cache_lock = threading.Lock()
 
         if github_token:
             self.session.headers.update(
@@ -83,6 +93,32 @@ class GitHubLicenseFetcher:
                 "spdx_id": str   # SPDX identifier
             }
         """
+        cache_key = (owner.lower(), repo.lower())
+        with self._license_cache_lock:
+            cached = self._license_cache.get(cache_key)
+            if cached is None and cache_key in self._missing_license_cache:
+                return None
+        if cached is not None:
+            return cached
+
+        license_info, definitive = self._fetch_license_from_repo(owner, repo)
+        # Errors (rate limits, timeouts, 5xx) are never cached
+        if definitive:
+            with self._license_cache_lock:
+                if license_info is not None:
+                    self._license_cache[cache_key] = license_info
+                else:
+                    self._missing_license_cache[cache_key] = True
+        return license_info
+
+    def _fetch_license_from_repo(
+        self, owner: str, repo: str
+    ) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Call the GitHub API for a repository's license (uncached).
+        Returns the license info and whether the answer is definitive,
+        i.e. GitHub responded rather than the request failing.
+        """
         url = f"{self.GITHUB_API_BASE}/repos/{owner}/{repo}"
 
         try:
@@ -90,15 +126,15 @@ class GitHubLicenseFetcher:
 
             if response.status_code == 404:
                 logger.warning(f"Repository not found: {owner}/{repo}")
-                return None
+                return None, True
             elif response.status_code == 403:
                 logger.error(f"GitHub API rate limit exceeded or access denied")
-                return None
+                return None, False
             elif response.status_code != 200:
                 logger.error(
                     f"GitHub API error {response.status_code}: {response.text}"
                 )
-                return None
+                return None, False
 
             data = response.json()
 
@@ -109,20 +145,20 @@ class GitHubLicenseFetcher:
                     "name": license_data.get("name", "Unknown"),
                     "url": license_data.get("url", ""),
                     "spdx_id": license_data.get("spdx_id", "NOASSERTION"),
-                }
+                }, True
             else:
                 logger.info(f"No license information found for {owner}/{repo}")
-                return None
+                return None, True
 
         except requests.exceptions.Timeout:
             logger.error(f"Timeout fetching license for {owner}/{repo}")
-            return None
+            return None, False
         except requests.exceptions.RequestException as e:
             logger.error(f"Error fetching license for {owner}/{repo}: {e}")
-            return None
+            return None, False
         except Exception as e:
             logger.error(f"Unexpected error fetching license: {e}")
-            return None
+            return None, False
 
     def get_license_from_url(self, github_url: str) -> Optional[Dict[str, Any]]:
         """
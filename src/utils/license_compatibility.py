@@ -15,11 +15,48 @@ Compatibility Rules:
 
 from typing import Dict, List, Tuple, Optional
 from enum import Enum
+from functools import lru_cache
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=1024)
+def _normalize_license(license_str: str) -> str:
+    """
+    Normalize license string for comparison.
+    Cached: the same few license strings are normalized on every check.
+    """
+    if not license_str:
+        return "unknown"
+
+    normalized = license_str.lower().strip()
+
+    # Handle common variations
+    normalized = normalized.replace("license", "").strip()
+    normalized = normalized.replace("licence", "").strip()
+    normalized = normalized.replace("_", "-")
+    normalized = normalized.replace(" ", "-")
+
+    # Handle version aliases
+    if normalized in ["gplv2", "gnu-gpl-2.0"]:
+        normalized = "gpl-2.0"
+    elif normalized in ["gplv3", "gnu-gpl-3.0"]:
+        normalized = "gpl-3.0"
+    elif normalized in ["lgplv2.1", "lgplv2", "gnu-lgpl-2.1"]:
+        normalized = "lgpl-2.1"
+    elif normalized in ["lgplv3", "gnu-lgpl-3.0"]:
+        normalized = "lgpl-3.0"
+    elif normalized in ["apache2", "apache-2", "apache2.0"]:
+        normalized = "apache-2.0"
+    elif normalized in ["bsd2", "bsd-2"]:
+        normalized = "bsd-2-clause"
+    elif normalized in ["bsd3", "bsd-3"]:
+        normalized = "bsd-3-clause"
+
+    return normalized
+
+
 class LicenseType(Enum):
     """License categories by strength of protection."""
 
@@ -78,34 +115,7 @@ class LicenseCompatibility:
 
     def normalize_license(self, license_str: str) -> str:
         """Normalize license string for comparison."""
-        if not license_str:
-            return "unknown"
-
-        normalized = license_str.lower().strip()
-
-        # Handle common variations
-        normalized = normalized.replace("license", "").strip()
-        normalized = normalized.replace("licence", "").strip()
-        normalized = normalized.replace("_", "-")
-        normalized = normalized.replace(" ", "-")
-
-        # Handle version aliases
-        if normalized in ["gplv2", "gnu-gpl-2.0"]:
-            normalized = "gpl-2.0"
-        elif normalized in ["gplv3", "gnu-gpl-3.0"]:
-            normalized = "gpl-3.0"
-        elif normalized in ["lgplv2.1", "lgplv2", "gnu-lgpl-2.1"]:
-            normalized = "lgpl-2.1"
-        elif normalized in ["lgplv3", "gnu-lgpl-3.0"]:
-            normalized = "lgpl-3.0"
-        elif normalized in ["apache2", "apache-2", "apache2.0"]:
-            normalized = "apache-2.0"
-        elif normalized in ["bsd2", "bsd-2"]:
-            normalized = "bsd-2-clause"
-        elif normalized in ["bsd3", "bsd-3"]:
-            normalized = "bsd-3-clause"
-
-        return normalized
+        return _normalize_license(license_str)
 
     def get_license_type(self, license_str: str) -> LicenseType:
         """Get the category/type of a license."""
@@ -0,0 +1,759 @@
+"""
+Tests for the artifact registry endpoints in src/api/main.py.
+Run with: pytest tests/test_artifact_api.py -v
+"""
+
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.api.main import (
+    app,
+    get_artifact_by_id,
+    generate_artifact_id,
+    backfill_artifact_ids,
+    record_download,
+    flush_downloads,
+    extract_name_from_url,
+    get_artifact_type_from_url,
+)
+from src.core.database import get_db
+from src.core.models import (
+    Base,
+    DownloadHistory,
+    Lineage,
+    Metrics,
+    Package,
+    Token,
+    User,
+)
+from src.core.auth import create_user, generate_token, authenticate_user, verify_token
+from src.core.config import settings
+from src.services.s3_service import s3_helper
+
+# Test database setup
+SQLALCHEMY_DATABASE_URL = "sqlite:///./test_artifact_api.db"
+engine = create_engine(
+    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+
+@pytest.fixture(scope="function")
+def test_db():
+    """Create test database"""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
+
+@pytest.fixture(scope="function")
+def client(test_db, monkeypatch):
+    """Create test client with test database and no real S3 calls"""
+
+    def override_get_db():
+        try:
+            db = TestingSessionLocal()
+            yield db
+        finally:
+            db.close()
+
+    monkeypatch.setattr(s3_helper, "delete_all_objects", lambda: 0)
+    monkeypatch.setattr(
+        s3_helper,
+        "generate_presigned_url",
+        lambda s3_key, expiration=300: f"https://s3.example.com/{s3_key}",
+    )
+    app.dependency_overrides[get_db] = override_get_db
+    return TestClient(app)
+
+
+@pytest.fixture
+def admin(test_db):
+    """Create the default admin user"""
+    db = TestingSessionLocal()
+    user = create_user(
+        db=db,
+        username=settings.admin_username,
+        password="stale-password",
+        permissions=["upload", "download", "search", "admin"],
+        is_admin=True,
+    )
+    db.close()
+    return user
+
+
+def add_package(name, artifact_type="model", uploader=None, artifact_id=None):
+    """Insert a package row directly"""
+    db = TestingSessionLocal()
+    package = Package(
+        name=name,
+        version=artifact_type,
+        artifact_id=artifact_id,
+        uploader_id=uploader.id if uploader else None,
+        s3_path=f"s3://{s3_helper.bucket_name}/{name}/{artifact_type}/package.zip",
+        size_bytes=1024 * 1024,
+    )
+    db.add(package)
+    db.commit()
+    db.refresh(package)
+    db.close()
+    return package
+
+
+# ========== Ingestion Tests ==========
+
+
+@pytest.fixture
+def ingest(client, admin, monkeypatch, tmp_path):
+    """Stub out the Hub download, S3 upload and metrics evaluation"""
+    import src.api.main as api
+    from src.services.huggingface_service import hf_service
+
+    scores = {"license": 1.0, "net_score": 0.8}
+    deleted = []
+    monkeypatch.setattr(
+        hf_service,
+        "download_model",
+        lambda model_id, cache_dir=None: (str(tmp_path), {"tags": ["license:mit"]}),
+    )
+    monkeypatch.setattr(s3_helper, "upload_stream", lambda s3_key, write: 1024)
+    monkeypatch.setattr(s3_helper, "delete_file", lambda s3_key: deleted.append(s3_key))
+    monkeypatch.setattr(api, "_evaluate_model", lambda url, package_id: dict(scores))
+    return scores, deleted
+
+
+def test_create_model_stores_metrics(client, ingest):
+    """A model is registered together with its metrics row"""
+    response = client.post(
+        "/artifact/model",
+        json={"url": "https://huggingface.co/google-bert/bert-base-uncased"},
+    )
+    assert response.status_code == 201
+    assert response.json()["data"]["size_bytes"] == 1024
+    assert response.json()["data"]["recommended_range_mib"] == 16
+
+    db = TestingSessionLocal()
+    package = db.query(Package).filter_by(name="bert-base-uncased").one()
+    assert package.artifact_id == response.json()["metadata"]["id"]
+    assert package.metrics.net_score == 0.8
+    db.close()
+
+
+def test_create_model_rejects_disqualified_license(client, ingest):
+    """A failing license score returns 424 and registers nothing"""
+    scores, deleted = ingest
+    scores["license"] = 0.0
+
+    response = client.post(
+        "/artifact/model",
+        json={"url": "https://huggingface.co/google-bert/bert-base-uncased"},
+    )
+    assert response.status_code == 424
+    assert deleted == ["bert-base-uncased/model/package.zip"]
+
+    db = TestingSessionLocal()
+    assert db.query(Package).count() == 0
+    db.close()
+
+
+def test_create_github_model_is_rated(client, ingest):
+    """Models from GitHub are evaluated too, so they can be rated"""
+    response = client.post(
+        "/artifact/model", json={"url": "https://github.com/owner/repo"}
+    )
+    assert response.status_code == 201
+    artifact_id = response.json()["metadata"]["id"]
+
+    response = client.get(f"/artifact/model/{artifact_id}/rate")
+    assert response.status_code == 200
+    assert response.json()["net_score"] == 0.8
+
+
+# ========== Reset Tests ==========
+
+
+def test_reset_clears_packages_and_tokens(client, admin):
+    """Reset removes packages and tokens in one transaction"""
+    add_package("bert-base-uncased", uploader=admin)
+    db = TestingSessionLocal()
+    generate_token(db, db.query(User).first())
+    db.close()
+
+    response = client.delete("/reset")
+    assert response.status_code == 200
+
+    db = TestingSessionLocal()
+    assert db.query(Package).count() == 0
+    assert db.query(Token).count() == 0
+    db.close()
+
+
+def test_reset_restores_admin_password(client, admin):
+    """Reset updates the existing admin in place with the configured password"""
+    response = client.delete("/reset")
+    assert response.status_code == 200
+
+    db = TestingSessionLocal()
+    user = authenticate_user(db, settings.admin_username, settings.admin_password)
+    assert user is not None
+    assert user.id == admin.id
+    assert user.is_admin
+    db.close()
+
+
+# ========== Artifact ID Tests ==========
+
+
+def test_get_artifact_by_id_uses_column(test_db):
+    """Lookup matches the stored artifact_id and optional type"""
+    add_package("bert-base-uncased", artifact_id="1234567890")
+    add_package("squad", artifact_type="dataset", artifact_id="42")
+
+    db = TestingSessionLocal()
+    assert get_artifact_by_id(db, "1234567890").name == "bert-base-uncased"
+    assert get_artifact_by_id(db, "1234567890", "model").name == "bert-base-uncased"
+    assert get_artifact_by_id(db, "1234567890", "dataset") is None
+    assert get_artifact_by_id(db, "999") is None
+    db.close()
+
+
+def test_get_artifact_by_id_ignores_stale_cache(test_db):
+    """A cached ID whose package was replaced resolves to the new row"""
+    old = add_package("bert-base-uncased", artifact_id="1234567890")
+    db = TestingSessionLocal()
+    assert get_artifact_by_id(db, "1234567890", "model").id == old.id
+    db.query(Package).delete()
+    db.commit()
+    db.close()
+
+    new = add_package("bert-base-uncased", artifact_id="1234567890")
+    db = TestingSessionLocal()
+    assert get_artifact_by_id(db, "1234567890", "model").id == new.id
+    db.close()
+
+
+def test_backfill_artifact_ids_from_description(test_db):
+    """Legacy rows get their ID copied out of the description field"""
+    db = TestingSessionLocal()
+    db.add(
+        Package(
+            name="legacy-model",
+            version="model",
+            description="artifact_id:5555",
+            s3_path="s3://bucket/legacy-model/model/package.zip",
+        )
+    )
+    db.commit()
+
+    assert backfill_artifact_ids(db) == 1
+    assert get_artifact_by_id(db, "5555").name == "legacy-model"
+    assert backfill_artifact_ids(db) == 0
+    db.close()
+
+
+def test_generate_artifact_id_is_numeric_and_unique():
+    """New IDs are 10-digit-or-shorter numeric strings that differ per call"""
+    ids = {generate_artifact_id("bert-base-uncased", "model") for _ in range(100)}
+    assert len(ids) == 100
+    assert all(i.isdigit() and len(i) <= 10 for i in ids)
+
+
+# ========== Token Cache Tests ==========
+
+
+def test_cached_token_still_consumes_calls(admin):
+    """Cached verifications keep decrementing and enforcing the call budget"""
+    db = TestingSessionLocal()
+    token = generate_token(db, db.query(User).first())
+    db_token = db.query(Token).first()
+    start = db_token.api_calls_remaining
+
+    assert verify_token(db, token).id == admin.id
+    assert verify_token(db, token).username == settings.admin_username
+
+    db.refresh(db_token)
+    assert db_token.api_calls_remaining == start - 2
+
+    db_token.api_calls_remaining = 0
+    db.commit()
+    assert verify_token(db, token) is None
+    db.close()
+
+
+def test_reset_invalidates_cached_tokens(client, admin):
+    """Tokens verified before a reset are rejected afterwards"""
+    db = TestingSessionLocal()
+    token = generate_token(db, db.query(User).first())
+    assert verify_token(db, token) is not None
+    db.close()
+
+    assert client.delete("/reset").status_code == 200
+
+    db = TestingSessionLocal()
+    assert verify_token(db, token) is None
+    db.close()
+
+
+def test_cached_token_sees_permission_changes_and_deletion(admin):
+    """A cached token reflects the user's current permissions and existence"""
+    from src.crud import delete_user, update_user_permissions
+
+    db = TestingSessionLocal()
+    user = create_user(db, "demoted", "pw", permissions=["upload", "admin"])
+    token = generate_token(db, user)
+    assert verify_token(db, token).permissions == ["upload", "admin"]
+
+    update_user_permissions(db, user.id, ["search"])
+    db.close()
+
+    db = TestingSessionLocal()
+    assert verify_token(db, token).permissions == ["search"]
+
+    delete_user(db, user.id)
+    assert verify_token(db, token) is None
+    db.close()
+
+
+# ========== Rating Tests ==========
+
+
+def test_rating_serializes_stored_metrics(client):
+    """Rating response is built from the metrics row without re-validation"""
+    package = add_package("bert-base-uncased", artifact_id="1234567890")
+    db = TestingSessionLocal()
+    db.add(
+        Metrics(
+            package_id=package.id,
+            net_score=0.8,
+            bus_factor=0.5,
+            size_score={
+                "raspberry_pi": 0,
+                "jetson_nano": 0.5,
+                "desktop_pc": 1,
+                "aws_server": 1,
+            },
+        )
+    )
+    db.commit()
+    db.close()
+
+    response = client.get("/artifact/model/1234567890/rate")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["name"] == "bert-base-uncased"
+    assert data["net_score"] == 0.8
+    assert data["ramp_up_time"] == 0
+    assert data["size_score"]["desktop_pc"] == 1
+
+
+# ========== Lineage and Cost Tests ==========
+
+
+def add_lineage(child, parent):
+    """Link a child package to its parent"""
+    db = TestingSessionLocal()
+    db.add(
+        Lineage(
+            package_id=child.id, parent_id=parent.id, relationship_type="base_model"
+        )
+    )
+    db.commit()
+    db.close()
+
+
+def test_lineage_includes_parents(client):
+    """Every parent becomes a node with an edge to the child"""
+    child = add_package("bert-finetuned", artifact_id="100")
+    for i in range(3):
+        add_lineage(child, add_package(f"bert-base-{i}", artifact_id=str(200 + i)))
+
+    response = client.get("/artifact/model/100/lineage")
+    assert response.status_code == 200
+    graph = response.json()
+    assert {n["artifact_id"] for n in graph["nodes"]} == {"100", "200", "201", "202"}
+    assert {e["from_node_artifact_id"] for e in graph["edges"]} == {"200", "201", "202"}
+    assert all(e["to_node_artifact_id"] == "100" for e in graph["edges"])
+
+
+def test_lineage_etag_changes_with_parents(client):
+    """Lineage responses revalidate until a new parent is recorded"""
+    child = add_package("child", artifact_id="1")
+    add_lineage(child, add_package("parent-a", artifact_id="2"))
+
+    etag = client.get("/artifact/model/1/lineage").headers["ETag"]
+    response = client.get("/artifact/model/1/lineage", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+
+    add_lineage(child, add_package("parent-b", artifact_id="3"))
+    response = client.get("/artifact/model/1/lineage", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+def test_cost_with_dependencies_sums_parents(client):
+    """Dependency cost adds each parent's size to the artifact's own"""
+    child = add_package("bert-finetuned", artifact_id="100")
+    add_lineage(child, add_package("bert-base", artifact_id="200"))
+
+    response = client.get("/artifact/model/100/cost?dependency=true")
+    assert response.status_code == 200
+    cost = response.json()
+    assert cost["100"] == {"standalone_cost": 1.0, "total_cost": 2.0}
+    assert cost["200"] == {"standalone_cost": 1.0, "total_cost": 1.0}
+
+
+def test_cost_with_dependencies_includes_ancestors(client):
+    """Grandparents are included and a shared ancestor is counted once"""
+    child = add_package("bert-finetuned", artifact_id="100")
+    parent_a = add_package("bert-distilled", artifact_id="200")
+    parent_b = add_package("bert-pruned", artifact_id="201")
+    root = add_package("bert-base", artifact_id="300")
+    add_lineage(child, parent_a)
+    add_lineage(child, parent_b)
+    add_lineage(parent_a, root)
+    add_lineage(parent_b, root)
+
+    response = client.get("/artifact/model/100/cost?dependency=true")
+    assert response.status_code == 200
+    cost = response.json()
+    assert set(cost) == {"100", "200", "201", "300"}
+    assert cost["100"]["total_cost"] == 4.0
+
+
+def test_cost_ancestor_totals_include_their_own_ancestors(client):
+    """Every entry's total covers its own chain in a three-level lineage"""
+    child = add_package("bert-finetuned", artifact_id="100")
+    parent = add_package("bert-distilled", artifact_id="200")
+    add_lineage(child, parent)
+    add_lineage(parent, add_package("bert-base", artifact_id="300"))
+
+    cost = client.get("/artifact/model/100/cost?dependency=true").json()
+    assert cost["100"] == {"standalone_cost": 1.0, "total_cost": 3.0}
+    assert cost["200"] == {"standalone_cost": 1.0, "total_cost": 2.0}
+    assert cost["300"] == {"standalone_cost": 1.0, "total_cost": 1.0}
+
+
+def test_cost_etag_changes_with_dependencies(client):
+    """Cost responses revalidate until the dependency set changes"""
+    child = add_package("bert-finetuned", artifact_id="100")
+    add_lineage(child, add_package("bert-base", artifact_id="200"))
+
+    response = client.get("/artifact/model/100/cost?dependency=true")
+    assert response.headers["Cache-Control"] == "private, no-cache"
+    etag = response.headers["ETag"]
+    response = client.get(
+        "/artifact/model/100/cost?dependency=true", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 304
+
+    add_lineage(child, add_package("bert-large", artifact_id="201"))
+    response = client.get(
+        "/artifact/model/100/cost?dependency=true", headers={"If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+
+
+# ========== List Tests ==========
+
+
+def test_list_artifacts_sets_offset_header(client):
+    """A full page returns the next offset in the response header"""
+    for i in range(51):
+        add_package(f"model-{i}", artifact_id=str(i))
+
+    response = client.post("/artifacts", json=[{"name": "*"}])
+    assert response.status_code == 200
+    assert len(response.json()) == 50
+    assert response.headers["offset"] == "50"
+    assert response.json()[0].keys() == {"name", "id", "type"}
+
+    response = client.post("/artifacts?offset=50", json=[{"name": "*"}])
+    assert len(response.json()) == 1
+    assert "offset" not in response.headers
+
+
+def test_list_artifacts_filters_by_type(client):
+    """Only packages of the requested types are returned"""
+    add_package("bert-base-uncased", artifact_id="1")
+    add_package("bert-squad", artifact_type="dataset", artifact_id="2")
+
+    response = client.post("/artifacts", json=[{"name": "bert", "types": ["dataset"]}])
+    assert response.status_code == 200
+    assert [a["name"] for a in response.json()] == ["bert-squad"]
+
+
+def test_list_artifacts_combines_queries(client):
+    """Several queries return each matching artifact once"""
+    add_package("bert-base-uncased", artifact_id="1")
+    add_package("bert-squad", artifact_type="dataset", artifact_id="2")
+    add_package("whisper-tiny", artifact_id="3")
+
+    response = client.post(
+        "/artifacts",
+        json=[
+            {"name": "bert"},
+            {"name": "squad"},
+            {"name": "*", "types": ["dataset"]},
+        ],
+    )
+    assert response.status_code == 200
+    assert sorted(a["id"] for a in response.json()) == ["1", "2"]
+
+
+def test_get_artifact_reports_size_for_ranged_downloads(client):
+    """The artifact body carries its size and a suggested range size"""
+    add_package("bert-base-uncased", artifact_id="1")
+
+    data = client.get("/artifacts/model/1").json()["data"]
+    assert data["size_bytes"] == 1024 * 1024
+    assert data["recommended_range_mib"] == 16
+
+
+# ========== Download History Tests ==========
+
+
+def test_get_artifact_queues_download(client):
+    """Downloads are queued and written in one batch on flush"""
+    package = add_package("bert-base-uncased", artifact_id="1234567890")
+
+    for _ in range(3):
+        response = client.get("/artifacts/model/1234567890")
+        assert response.status_code == 200
+
+    db = TestingSessionLocal()
+    assert db.query(DownloadHistory).count() == 0
+    assert flush_downloads(db) == 3
+    assert db.query(DownloadHistory).filter_by(package_id=package.id).count() == 3
+    db.close()
+
+
+def test_flush_drops_downloads_of_deleted_packages(test_db):
+    """Queued rows for packages deleted before the flush are skipped"""
+    package = add_package("bert-base-uncased")
+    record_download(package.id)
+    record_download(uuid.uuid4())
+
+    db = TestingSessionLocal()
+    assert flush_downloads(db) == 1
+    assert db.query(DownloadHistory).count() == 1
+    db.close()
+
+
+# ========== URL Parsing Tests ==========
+
+
+@pytest.mark.parametrize(
+    "url,name,artifact_type",
+    [
+        (
+            "https://huggingface.co/google-bert/bert-base-uncased",
+            "bert-base-uncased",
+            "model",
+        ),
+        (
+            "https://huggingface.co/openai/whisper-tiny/tree/main",
+            "whisper-tiny",
+            "model",
+        ),
+        ("https://huggingface.co/datasets/squad", "squad", "dataset"),
+        ("https://huggingface.co/datasets/rajpurkar/squad/", "squad", "dataset"),
+        (
+            "https://huggingface.co/bert-base-uncased/tree/main",
+            "bert-base-uncased",
+            "model",
+        ),
+        (
+            "https://huggingface.co/google-bert/bert-base-uncased/discussions",
+            "bert-base-uncased",
+            "model",
+        ),
+        ("https://github.com/owner/repo", "repo", "code"),
+        ("https://github.com/owner/repo/issues/1", "repo", "code"),
+        ("https://example.com/files/archive", "archive", "model"),
+    ],
+)
+def test_url_classification(url, name, artifact_type):
+    """Name and type are derived from a single parse of the URL"""
+    assert extract_name_from_url(url) == name
+    assert get_artifact_type_from_url(url).value == artifact_type
+
+
+# ========== Authentication Tests ==========
+
+
+@pytest.mark.parametrize("method", ["PUT", "POST"])
+def test_authenticate_accepts_put_and_post(client, method):
+    """Both methods share one handler and return a bearer token"""
+    db = TestingSessionLocal()
+    create_user(
+        db=db, username="alice", password="correct-horse", permissions=["search"]
+    )
+    db.close()
+    body = {
+        "user": {"name": "alice", "is_admin": False},
+        "secret": {"password": "correct-horse"},
+    }
+
+    response = client.request(method, "/authenticate", json=body)
+    assert response.status_code == 200
+    assert response.json().startswith("bearer ")
+
+    body["secret"]["password"] = ""
+    assert client.request(method, "/authenticate", json=body).status_code == 401
+
+
+# ========== Regex Search Tests ==========
+
+
+def test_regex_search_matches_name_and_readme(client):
+    """Names and READMEs are searched case-insensitively"""
+    add_package("bert-base-uncased", artifact_id="1")
+    add_package("whisper-tiny", artifact_id="2")
+    db = TestingSessionLocal()
+    db.query(Package).filter_by(name="whisper-tiny").update(
+        {"model_card": "Speech model by OpenAI"}
+    )
+    db.commit()
+    db.close()
+
+    response = client.post("/artifact/byRegEx", json={"regex": "^BERT"})
+    assert response.status_code == 200
+    assert response.json() == [
+        {"name": "bert-base-uncased", "id": "1", "type": "model"}
+    ]
+
+    response = client.post("/artifact/byRegEx", json={"regex": "openai"})
+    assert [a["id"] for a in response.json()] == ["2"]
+
+    assert client.post("/artifact/byRegEx", json={"regex": "gpt"}).status_code == 404
+    assert client.post("/artifact/byRegEx", json={"regex": "("}).status_code == 400
+
+
+def test_regex_search_reads_readmes_only_for_name_misses(client, monkeypatch):
+    """Matches are found across batches, by name or by README"""
+    import src.api.main as api
+
+    monkeypatch.setattr(api, "REGEX_SEARCH_BATCH_SIZE", 2)
+    for i in range(5):
+        add_package(f"model-{i}", artifact_id=str(i))
+    db = TestingSessionLocal()
+    db.query(Package).filter(Package.name.in_(["model-1", "model-4"])).update(
+        {"model_card": "fine-tuned llama"}, synchronize_session=False
+    )
+    db.commit()
+    db.close()
+
+    response = client.post("/artifact/byRegEx", json={"regex": "llama|model-2"})
+    assert sorted(a["id"] for a in response.json()) == ["1", "2", "4"]
+
+
+def test_regex_search_word_boundary(client):
+    """Word-boundary patterns match whole words only"""
+    add_package("bert-base", artifact_id="1")
+    add_package("roberta", artifact_id="2")
+
+    response = client.post("/artifact/byRegEx", json={"regex": r"\bbert\b"})
+    assert response.status_code == 200
+    assert [a["id"] for a in response.json()] == ["1"]
+
+
+@pytest.mark.parametrize(
+    "pattern,compatible",
+    [
+        (r"^bert-.*", True),
+        (r"\bbert\b", False),
+        (r"\Bert", False),
+        (r"\\bert", True),
+        (r"\\\bert", False),
+    ],
+)
+def test_word_boundary_patterns_skip_postgres(pattern, compatible):
+    """Word-boundary escapes are matched in Python, not by Postgres ~*"""
+    from src.api.main import _postgres_compatible
+
+    assert _postgres_compatible(pattern) is compatible
+
+
+# ========== By Name Tests ==========
+
+
+def test_by_name_prefers_exact_case(client):
+    """Exact-case matches win; otherwise names match case-insensitively"""
+    add_package("Bert", artifact_id="1")
+    add_package("bert", artifact_id="2")
+    add_package("bert_x", artifact_id="3")
+
+    response = client.get("/artifact/byName/bert")
+    assert response.status_code == 200
+    assert [a["id"] for a in response.json()] == ["2"]
+
+    response = client.get("/artifact/byName/BERT")
+    assert sorted(a["id"] for a in response.json()) == ["1", "2"]
+
+    assert client.get("/artifact/byName/bert%").status_code == 404
+
+
+def test_by_name_honours_if_none_match(client):
+    """A matching If-None-Match gets 304 with no body"""
+    add_package("bert", artifact_id="1")
+
+    response = client.get("/artifact/byName/bert")
+    etag = response.headers["ETag"]
+
+    response = client.get("/artifact/byName/bert", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+
+    add_package("Bert", artifact_id="2")
+    response = client.get("/artifact/byName/BERT", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+
+
+# ========== Middleware Tests ==========
+
+
+def test_request_id_header(client):
+    """Responses carry a request ID, echoing the caller's when given"""
+    generated = client.get("/tracks").headers["X-Request-ID"]
+    assert len(generated) == 32
+    assert client.get("/tracks").headers["X-Request-ID"] != generated
+
+    response = client.get("/tracks", headers={"X-Request-ID": "abc-123"})
+    assert response.headers["X-Request-ID"] == "abc-123"
+
+
+def test_large_responses_are_gzipped(client):
+    """Bodies over 1 KB are compressed for clients that accept gzip"""
+    for i in range(50):
+        add_package(f"model-{i}", artifact_id=str(i))
+
+    response = client.post(
+        "/artifacts", json=[{"name": "*"}], headers={"Accept-Encoding": "gzip"}
+    )
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert len(response.json()) == 50
+
+    response = client.get("/tracks", headers={"Accept-Encoding": "gzip"})
+    assert "Content-Encoding" not in response.headers
+
+
+def test_health_result_is_cached(client, monkeypatch):
+    """Probes within the TTL reuse one set of component checks"""
+    import src.api.main as api
+
+    calls = []
+    monkeypatch.setattr(
+        api, "_check_health", lambda: calls.append(1) or {"status": "healthy"}
+    )
+    api._health_cache.clear()
+
+    for _ in range(3):
+        assert client.get("/health").json() == {"status": "healthy"}
+    assert len(calls) == 1
+
+    api._health_cache.clear()
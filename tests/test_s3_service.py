@@ -0,0 +1,195 @@
+"""
+Tests for the S3 helper.
+Uses a mocked boto3 client, so no bucket or network access is needed.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.services.s3_service import S3Helper
+
+
+@pytest.fixture
+def helper():
+    """S3Helper with a mocked client"""
+    s3 = S3Helper()
+    s3.s3_client = MagicMock()
+    s3.s3_client.delete_objects.return_value = {}
+    return s3
+
+
+def test_bulk_delete_batches_1000_keys(helper):
+    """bulk_delete splits keys into DeleteObjects calls of at most 1000"""
+    keys = [f"model-{i}/model/package.zip" for i in range(2500)]
+
+    deleted = helper.bulk_delete(keys)
+
+    assert deleted == 2500
+    calls = helper.s3_client.delete_objects.call_args_list
+    assert [len(c.kwargs["Delete"]["Objects"]) for c in calls] == [1000, 1000, 500]
+
+
+def test_bulk_delete_excludes_errors_from_count(helper):
+    """Keys reported in Errors are not counted as deleted"""
+    helper.s3_client.delete_objects.return_value = {
+        "Errors": [{"Key": "a", "Message": "AccessDenied"}]
+    }
+
+    assert helper.bulk_delete(["a", "b", "c"]) == 2
+
+
+def test_bulk_delete_empty(helper):
+    """No request is made when there is nothing to delete"""
+    assert helper.bulk_delete([]) == 0
+    helper.s3_client.delete_objects.assert_not_called()
+
+
+def test_delete_all_objects_deletes_every_page(helper):
+    """Each listed page is deleted and the counts are summed"""
+    pages = [
+        {"Contents": [{"Key": f"p{p}-{i}"} for i in range(1000)]} for p in range(3)
+    ] + [{}]
+    helper.s3_client.get_paginator.return_value.paginate.return_value = pages
+
+    assert helper.delete_all_objects() == 3000
+    deleted = {
+        obj["Key"]
+        for c in helper.s3_client.delete_objects.call_args_list
+        for obj in c.kwargs["Delete"]["Objects"]
+    }
+    assert len(deleted) == 3000
+
+
+def test_upload_file_uses_parallel_multipart_config(helper):
+    """File uploads go through the transfer manager in concurrent parts"""
+    assert helper.upload_file("/tmp/package.zip", "a/model/package.zip")
+
+    config = helper.s3_client.upload_file.call_args.kwargs["Config"]
+    assert config.multipart_chunksize == 16 * 1024 * 1024
+    assert config.max_concurrency == 10
+
+
+class FakeMultipartClient:
+    """Minimal stand-in for the multipart upload API"""
+
+    def __init__(self):
+        self.parts = {}
+        self.completed = None
+        self.aborted = False
+        self.put = None
+
+    def create_multipart_upload(self, Bucket, Key):
+        return {"UploadId": "upload-1"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.parts[PartNumber] = Body
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = b"".join(
+            self.parts[p["PartNumber"]] for p in MultipartUpload["Parts"]
+        )
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+    def put_object(self, Bucket, Key, Body):
+        self.put = Body
+
+
+def test_upload_stream_writes_zip_in_parts(tmp_path, monkeypatch):
+    """A zip streamed through upload_stream is reassembled intact from its parts"""
+    import io
+    import zipfile
+    from src.services.huggingface_service import HuggingFaceIngestionService
+    from src.services.s3_service import MultipartUploadWriter
+
+    (tmp_path / "config.json").write_text('{"model_type": "bert"}')
+    (tmp_path / "weights.bin").write_bytes(b"\x00" * 300_000)
+
+    helper = S3Helper()
+    helper.s3_client = FakeMultipartClient()
+    monkeypatch.setattr(MultipartUploadWriter, "PART_SIZE", 100_000)
+
+    size = helper.upload_stream(
+        "bert/model/package.zip",
+        lambda f: HuggingFaceIngestionService.write_package_zip(str(tmp_path), f),
+    )
+
+    data = helper.s3_client.completed
+    assert size == len(data)
+    assert len(helper.s3_client.parts) > 1
+    with zipfile.ZipFile(io.BytesIO(data)) as zf:
+        assert sorted(zf.namelist()) == ["config.json", "weights.bin"]
+        assert zf.read("weights.bin") == b"\x00" * 300_000
+
+
+def test_upload_stream_aborts_on_writer_error(monkeypatch):
+    """A failing writer aborts the multipart upload and returns None"""
+    from src.services.s3_service import MultipartUploadWriter
+
+    helper = S3Helper()
+    helper.s3_client = FakeMultipartClient()
+    monkeypatch.setattr(MultipartUploadWriter, "PART_SIZE", 4)
+
+    def fail(stream):
+        stream.write(b"partial")
+        raise IOError("disk error")
+
+    assert helper.upload_stream("x/model/package.zip", fail) is None
+    assert helper.s3_client.aborted
+    assert helper.s3_client.completed is None
+
+
+def test_upload_stream_aborts_when_completion_fails(monkeypatch):
+    """A failure while completing the upload still aborts it"""
+    from src.services.s3_service import MultipartUploadWriter
+
+    helper = S3Helper()
+    helper.s3_client = FakeMultipartClient()
+    monkeypatch.setattr(MultipartUploadWriter, "PART_SIZE", 4)
+
+    def fail(Bucket, Key, UploadId, MultipartUpload):
+        raise IOError("connection reset")
+
+    helper.s3_client.complete_multipart_upload = fail
+
+    assert helper.upload_stream("x/model/package.zip", lambda f: f.write(b"partial")) is None
+    assert helper.s3_client.aborted
+
+
+def test_upload_stream_small_object_uses_put_object():
+    """Content smaller than one part is sent with a single PutObject"""
+    helper = S3Helper()
+    helper.s3_client = FakeMultipartClient()
+
+    size = helper.upload_stream("x/code/package.zip", lambda f: f.write(b"# README"))
+
+    assert size == 8
+    assert helper.s3_client.put == b"# README"
+    assert helper.s3_client.parts == {}
+    assert helper.s3_client.completed is None
+
+
+def test_presigned_url_is_cached(helper):
+    """Repeated requests for the same key reuse the signed URL"""
+    helper.s3_client.generate_presigned_url.side_effect = ["url-1", "url-2", "url-3"]
+
+    assert helper.generate_presigned_url("a/model/package.zip", 3600) == "url-1"
+    assert helper.generate_presigned_url("a/model/package.zip", 3600) == "url-1"
+    assert helper.generate_presigned_url("a/model/package.zip", 300) == "url-2"
+    assert helper.s3_client.generate_presigned_url.call_count == 2
+
+
+def test_presigned_url_failure_not_cached(helper):
+    """A signing failure is retried on the next request"""
+    from botocore.exceptions import ClientError
+
+    helper.s3_client.generate_presigned_url.side_effect = [
+        ClientError({"Error": {"Code": "500"}}, "GeneratePresignedUrl"),
+        "url-1",
+    ]
+
+    assert helper.generate_presigned_url("a/model/package.zip") is None
+    assert helper.generate_presigned_url("a/model/package.zip") == "url-1"
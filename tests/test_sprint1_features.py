@@ -216,6 +216,39 @@ def test_github_license_fetcher_extracts_repo_info():
     assert result2["repo"] == "project"
 
 
+def test_github_license_fetcher_caches_successful_lookups():
+    """Test that repeated lookups of a repository hit GitHub once"""
+    from unittest.mock import MagicMock
+
+    fetcher = GitHubLicenseFetcher()
+    ok = MagicMock(status_code=200)
+    ok.json.return_value = {"license": {"key": "mit", "name": "MIT License", "spdx_id": "MIT"}}
+    fetcher.session.get = MagicMock(side_effect=[MagicMock(status_code=403), ok])
+
+    # Failures are not cached
+    assert fetcher.get_license_from_url("https://github.com/owner/repo") is None
+    assert fetcher.get_license_from_url("https://github.com/owner/repo")["license"] == "mit"
+    assert fetcher.get_license_from_url("https://github.com/Owner/Repo")["license"] == "mit"
+
+
+def test_github_license_fetcher_caches_missing_licenses_briefly():
+    """Test that a repository without a license is not re-fetched immediately"""
+    from unittest.mock import MagicMock
+
+    fetcher = GitHubLicenseFetcher()
+    unlicensed = MagicMock(status_code=200)
+    unlicensed.json.return_value = {"license": None}
+    fetcher.session.get = MagicMock(return_value=unlicensed)
+
+    assert fetcher.get_license_from_url("https://github.com/owner/repo") is None
+    assert fetcher.get_license_from_url("https://github.com/owner/repo") is None
+    assert fetcher.session.get.call_count == 1
+
+    fetcher._missing_license_cache.clear()
+    assert fetcher.get_license_from_url("https://github.com/owner/repo") is None
+    assert fetcher.session.get.call_count == 2
+
+
 # ========== Rate Limiting Tests ==========
 
 